@@ -141,6 +141,10 @@ class TestingConfig(Config):
     # Fast token expiration for testing
     JWT_ACCESS_TOKEN_EXPIRES = timedelta(minutes=15)
     
+    # Symmetric signing keeps token sign/verify cheap in tests
+    JWT_ALGORITHM = 'HS256'
+    JWT_SECRET_KEY = 'test-jwt-secret'
+    
     # Mock external services
     MOCK_AI_SERVICES = True
     MOCK_STRIPE = True
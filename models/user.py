@@ -12,6 +12,10 @@ from enum import Enum
 from app import db
 
 
+# Stands in for the password when User.from_prehashed supplies password_hash
+_PREHASHED = object()
+
+
 class UserStatus(Enum):
     """User account status enumeration"""
     ACTIVE = 'active'
@@ -50,8 +54,8 @@ class User(db.Model):
     
     # Authentication and security
     email_verified = db.Column(db.Boolean, default=False, nullable=False)
-    email_verification_token = db.Column(db.String(128), nullable=True)
-    password_reset_token = db.Column(db.String(128), nullable=True)
+    email_verification_token = db.Column(db.String(128), nullable=True, index=True)
+    password_reset_token = db.Column(db.String(128), nullable=True, index=True)
     password_reset_expires = db.Column(db.DateTime, nullable=True)
     
     # Usage tracking
@@ -79,23 +83,34 @@ class User(db.Model):
     def __init__(self, email, password, **kwargs):
         """Initialize user with secure password hashing"""
         self.email = email.lower().strip()
-        self.set_password(password)
+        if password is not _PREHASHED:
+            self.set_password(password)
         
         for key, value in kwargs.items():
             if hasattr(self, key):
                 setattr(self, key, value)
 
-    def set_password(self, password):
-        """Hash and set password securely"""
+    @classmethod
+    def from_prehashed(cls, email, password_hash, **kwargs):
+        """Create user from an existing password hash, skipping key derivation"""
+        return cls(email, _PREHASHED, password_hash=password_hash, **kwargs)
+
+    @staticmethod
+    def hash_password(password):
+        """Return a secure hash for the given password"""
         if len(password) < 8:
             raise ValueError("Password must be at least 8 characters long")
         
-        self.password_hash = generate_password_hash(
+        return generate_password_hash(
             password, 
             method='pbkdf2:sha256',
             salt_length=16
         )
 
+    def set_password(self, password):
+        """Hash and set password securely"""
+        self.password_hash = self.hash_password(password)
+
     def check_password(self, password):
         """Verify password against hash"""
         return check_password_hash(self.password_hash, password)
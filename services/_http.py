@@ -0,0 +1,18 @@
+"""
+TalkingPhoto AI MVP - Shared HTTP Session
+Keep-alive connection pool reused by the AI provider integrations
+"""
+
+import atexit
+import requests
+from requests.adapters import HTTPAdapter
+
+# One session per process so consecutive calls to the same provider host
+# reuse the open TCP/TLS connection instead of handshaking every time
+HTTP_SESSION = requests.Session()
+
+_adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20)
+HTTP_SESSION.mount('https://', _adapter)
+HTTP_SESSION.mount('http://', _adapter)
+
+atexit.register(HTTP_SESSION.close)
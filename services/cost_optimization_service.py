@@ -5,11 +5,13 @@ Smart API routing and cost optimization for video generation
 
 import json
 import time
+import threading
 from datetime import datetime, timezone, timedelta
 from typing import Dict, Any, List, Optional, Tuple
 from dataclasses import dataclass
 from enum import Enum
 import numpy as np
+from cachetools import TTLCache
 from redis import Redis
 import structlog
 from flask import current_app
@@ -78,6 +80,11 @@ class CostOptimizationService:
             'off_peak': 0.8    # 12 AM - 9 AM and weekends
         }
         
+        # Parsed provider metrics kept in process briefly; they drift over
+        # minutes, so repeated selections need not hit Redis every time
+        self._metrics_cache = TTLCache(maxsize=32, ttl=5)
+        self._metrics_cache_lock = threading.Lock()
+        
         # Initialize provider metrics cache
         self._init_metrics_cache()
     
@@ -114,17 +121,17 @@ class CostOptimizationService:
         """
         user_preferences = user_preferences or {}
         
-        # Get current metrics for all providers
+        # Only consider providers that support the requirements
+        supported_providers = [
+            provider for provider in VideoGenerationProvider
+            if self._provider_supports_requirements(provider, duration, quality, aspect_ratio)
+        ]
+        
+        # Get current metrics for all candidate providers
+        provider_metrics = self._get_providers_metrics(supported_providers)
         provider_scores = []
         
-        for provider in VideoGenerationProvider:
-            # Check if provider supports requirements
-            if not self._provider_supports_requirements(provider, duration, quality, aspect_ratio):
-                continue
-            
-            # Get provider metrics
-            metrics = self._get_provider_metrics(provider)
-            
+        for provider, metrics in provider_metrics.items():
             # Calculate cost estimate
             cost_estimate = self._calculate_cost_estimate(provider, duration, quality, metrics)
             
@@ -173,9 +180,47 @@ class CostOptimizationService:
     
     def _get_provider_metrics(self, provider: VideoGenerationProvider) -> ProviderMetrics:
         """Get current metrics for provider"""
+        with self._metrics_cache_lock:
+            metrics = self._metrics_cache.get(provider)
+        if metrics is not None:
+            return metrics
+        
         metrics_key = f"provider_metrics:{provider.value}"
         metrics_data = self.redis_client.hgetall(metrics_key)
+        metrics = self._parse_provider_metrics(provider, metrics_data)
+        
+        with self._metrics_cache_lock:
+            self._metrics_cache[provider] = metrics
+        return metrics
+    
+    def _get_providers_metrics(self, providers: List[VideoGenerationProvider]) -> Dict[VideoGenerationProvider, ProviderMetrics]:
+        """Get current metrics for several providers in a single Redis round trip"""
+        with self._metrics_cache_lock:
+            cached = {
+                provider: self._metrics_cache[provider]
+                for provider in providers if provider in self._metrics_cache
+            }
+        missing = [provider for provider in providers if provider not in cached]
+        
+        if missing:
+            pipe = self.redis_client.pipeline(transaction=False)
+            for provider in missing:
+                pipe.hgetall(f"provider_metrics:{provider.value}")
+            
+            fetched = {
+                provider: self._parse_provider_metrics(provider, metrics_data)
+                for provider, metrics_data in zip(missing, pipe.execute())
+            }
+            with self._metrics_cache_lock:
+                self._metrics_cache.update(fetched)
+            cached.update(fetched)
         
+        # Keep the caller's provider order
+        return {provider: cached[provider] for provider in providers if provider in cached}
+    
+    def _parse_provider_metrics(self, provider: VideoGenerationProvider,
+                                metrics_data: Dict[str, str]) -> ProviderMetrics:
+        """Build provider metrics from a Redis hash, falling back to defaults"""
         return ProviderMetrics(
             provider=provider,
             success_rate=float(metrics_data.get('success_rate', 0.95)),
@@ -384,6 +429,10 @@ class CostOptimizationService:
             self.redis_client.hset(metrics_key, mapping=updated_metrics)
             self.redis_client.expire(metrics_key, 86400)  # Refresh TTL
             
+            # Next selection in this process should see the new metrics
+            with self._metrics_cache_lock:
+                self._metrics_cache.pop(provider, None)
+            
             # Log metrics update
             logger.info("Provider metrics updated",
                        provider=provider.value,
@@ -398,6 +447,10 @@ class CostOptimizationService:
         try:
             metrics_key = f"provider_metrics:{provider.value}"
             self.redis_client.hincrby(metrics_key, 'current_load', 1)
+            
+            # Load balancing must see the new load on the next selection
+            with self._metrics_cache_lock:
+                self._metrics_cache.pop(provider, None)
         except Exception as e:
             logger.error("Failed to increment provider load", error=str(e))
     
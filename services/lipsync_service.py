@@ -8,6 +8,7 @@ import cv2
 import base64
 import json
 import io
+import threading
 import time
 from datetime import datetime, timezone
 from typing import Dict, Any, List, Tuple, Optional
@@ -47,6 +48,34 @@ class VisemeType(Enum):
     WW = 'ww'  # "w" as in "way"
 
 
+# Mouth deformation per viseme: [width_scale, height_scale, openness]
+MOUTH_DEFORMATIONS = {
+    VisemeType.SILENCE: [1.0, 1.0, 0.0],
+    VisemeType.AA: [1.2, 1.3, 0.8],  # Wide open
+    VisemeType.EE: [1.3, 0.9, 0.3],  # Wide, slightly open
+    VisemeType.II: [1.1, 0.95, 0.2],  # Slightly wide, barely open
+    VisemeType.OO: [0.8, 1.1, 0.6],  # Rounded, open
+    VisemeType.UU: [0.9, 1.0, 0.4],  # Slightly rounded
+    VisemeType.FF: [1.0, 0.9, 0.1],  # Lower lip under teeth
+    VisemeType.TH: [1.0, 0.95, 0.15],  # Tongue between teeth
+    VisemeType.DD: [1.0, 1.0, 0.2],  # Slightly open
+    VisemeType.KK: [0.95, 1.0, 0.3],  # Back of mouth
+    VisemeType.PP: [0.9, 0.95, 0.0],  # Lips pressed
+    VisemeType.MM: [0.95, 1.0, 0.0],  # Lips together
+    VisemeType.NN: [1.0, 1.0, 0.25],  # Slightly open
+    VisemeType.LL: [1.0, 1.0, 0.3],  # Tongue visible
+    VisemeType.RR: [1.05, 1.0, 0.35],  # Slightly rounded
+    VisemeType.SS: [1.1, 0.95, 0.1],  # Teeth visible
+    VisemeType.SH: [0.95, 1.05, 0.3],  # Lips forward
+    VisemeType.CH: [1.0, 1.0, 0.25],  # Similar to SH
+    VisemeType.WW: [0.85, 1.05, 0.4]  # Rounded, forward
+}
+
+# Per-viseme lookup table so deformation is a single row index
+VISEME_INDEX = {viseme_type: i for i, viseme_type in enumerate(VisemeType)}
+MOUTH_DEFORMATION_TABLE = np.array([MOUTH_DEFORMATIONS[v] for v in VisemeType])
+
+
 @dataclass
 class Viseme:
     """Viseme data structure"""
@@ -117,12 +146,38 @@ class LipSyncAnimationEngine:
     Advanced lip-sync animation engine with facial landmark integration
     """
     
+    # Character to viseme table used when no phoneme transcript is available
+    CHAR_TO_VISEME = {
+        # Vowels
+        'a': VisemeType.AA, 'e': VisemeType.EE, 'i': VisemeType.II,
+        'o': VisemeType.OO, 'u': VisemeType.UU,
+        
+        # Consonants
+        'b': VisemeType.PP, 'p': VisemeType.PP, 'm': VisemeType.MM,
+        'f': VisemeType.FF, 'v': VisemeType.FF, 'w': VisemeType.WW,
+        'd': VisemeType.DD, 't': VisemeType.DD, 'n': VisemeType.NN,
+        'l': VisemeType.LL, 'r': VisemeType.RR, 's': VisemeType.SS,
+        'z': VisemeType.SS, 'k': VisemeType.KK, 'g': VisemeType.KK,
+        'h': VisemeType.AA, 'j': VisemeType.CH, 'c': VisemeType.KK
+    }
+    
     def __init__(self):
         # Initialize face detection and landmark models
         self.mp_face_mesh = mp.solutions.face_mesh
         self.mp_drawing = mp.solutions.drawing_utils
         self.mp_drawing_styles = mp.solutions.drawing_styles
         
+        # Load the face mesh model once and reuse it for every image
+        self._face_mesh = self.mp_face_mesh.FaceMesh(
+            static_image_mode=True,
+            max_num_faces=1,
+            refine_landmarks=True,
+            min_detection_confidence=0.5
+        )
+        # The graph is not safe to run from two threads at once, and the
+        # video pipeline extracts landmarks on an executor thread
+        self._face_mesh_lock = threading.Lock()
+        
         # Dlib predictor for 68-point landmarks (if available)
         try:
             predictor_path = current_app.config.get('DLIB_PREDICTOR_PATH',
@@ -147,6 +202,12 @@ class LipSyncAnimationEngine:
         self.fps = 30  # Target frame rate
         self.smoothing_window = 3  # Frames to smooth transitions
     
+    def __del__(self):
+        """Release the MediaPipe graph held by the cached face mesh"""
+        face_mesh = getattr(self, '_face_mesh', None)
+        if face_mesh is not None:
+            face_mesh.close()
+    
     def generate_lip_sync_animation(self, image_path: str, audio_data: bytes,
                                    transcript: str = None, options: Dict[str, Any] = None) -> Dict[str, Any]:
         """
@@ -225,34 +286,29 @@ class LipSyncAnimationEngine:
             rgb_image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
             
             # Try MediaPipe first (more accurate for diverse faces)
-            with self.mp_face_mesh.FaceMesh(
-                static_image_mode=True,
-                max_num_faces=1,
-                refine_landmarks=True,
-                min_detection_confidence=0.5
-            ) as face_mesh:
-                results = face_mesh.process(rgb_image)
+            with self._face_mesh_lock:
+                results = self._face_mesh.process(rgb_image)
+            
+            if results.multi_face_landmarks:
+                face_landmarks = results.multi_face_landmarks[0]
                 
-                if results.multi_face_landmarks:
-                    face_landmarks = results.multi_face_landmarks[0]
-                    
-                    # Convert to numpy array
-                    h, w = image.shape[:2]
-                    points = np.array([
-                        [lm.x * w, lm.y * h, lm.z * w]
-                        for lm in face_landmarks.landmark
-                    ])
-                    
-                    # Calculate bounding box
-                    x_min, y_min = points[:, :2].min(axis=0).astype(int)
-                    x_max, y_max = points[:, :2].max(axis=0).astype(int)
-                    
-                    return FacialLandmarks(
-                        points=points,
-                        confidence=0.95,
-                        face_rect=(x_min, y_min, x_max - x_min, y_max - y_min),
-                        model_type='mediapipe'
-                    )
+                # Convert to numpy array
+                h, w = image.shape[:2]
+                points = np.array([
+                    [lm.x * w, lm.y * h, lm.z * w]
+                    for lm in face_landmarks.landmark
+                ])
+                
+                # Calculate bounding box
+                x_min, y_min = points[:, :2].min(axis=0).astype(int)
+                x_max, y_max = points[:, :2].max(axis=0).astype(int)
+                
+                return FacialLandmarks(
+                    points=points,
+                    confidence=0.95,
+                    face_rect=(x_min, y_min, x_max - x_min, y_max - y_min),
+                    model_type='mediapipe'
+                )
             
             # Fallback to Dlib if available
             if self.dlib_detector and self.dlib_predictor:
@@ -317,6 +373,7 @@ class LipSyncAnimationEngine:
             
             visemes = []
             current_time = 0.0
+            char_lookup = self.CHAR_TO_VISEME.get
             
             for word in words:
                 # Add silence between words
@@ -331,8 +388,8 @@ class LipSyncAnimationEngine:
                     current_time += 0.1
                 
                 # Generate visemes for word (simplified)
-                for i, char in enumerate(word.lower()):
-                    viseme_type = self._char_to_viseme(char)
+                for char in word.lower():
+                    viseme_type = char_lookup(char, VisemeType.SILENCE)
                     intensity = 0.8 if char in 'aeiou' else 0.6
                     
                     visemes.append(Viseme(
@@ -364,20 +421,12 @@ class LipSyncAnimationEngine:
             
             # Calculate amplitude envelope
             window_size = int(framerate * 0.02)  # 20ms windows
-            n_windows = len(samples) // window_size
+            envelope = self._rms_envelope(samples, window_size)
             
             visemes = []
             viseme_types = [VisemeType.AA, VisemeType.EE, VisemeType.OO, VisemeType.MM]
             
-            for i in range(n_windows):
-                start_idx = i * window_size
-                end_idx = start_idx + window_size
-                window_samples = samples[start_idx:end_idx]
-                
-                # Calculate RMS amplitude
-                rms = np.sqrt(np.mean(window_samples ** 2))
-                normalized_rms = min(rms / 32768.0, 1.0)
-                
+            for i, normalized_rms in enumerate(envelope.tolist()):
                 # Map amplitude to viseme
                 if normalized_rms < 0.1:
                     viseme_type = VisemeType.SILENCE
@@ -404,54 +453,54 @@ class LipSyncAnimationEngine:
             logger.error("Audio amplitude analysis failed", error=str(e))
             return []
     
+    @staticmethod
+    def _rms_envelope(samples: np.ndarray, window_size: int) -> np.ndarray:
+        """
+        Normalized RMS amplitude per window, computed for all windows at once
+        """
+        n_windows = len(samples) // window_size
+        windows = samples[:n_windows * window_size].astype(np.float32).reshape(n_windows, window_size)
+        
+        rms = np.sqrt(np.mean(np.square(windows), axis=1))
+        return np.minimum(rms / 32768.0, 1.0)
+    
     def _char_to_viseme(self, char: str) -> VisemeType:
         """
         Simple character to viseme mapping
         """
-        vowels = {
-            'a': VisemeType.AA, 'e': VisemeType.EE, 'i': VisemeType.II,
-            'o': VisemeType.OO, 'u': VisemeType.UU
-        }
-        
-        consonants = {
-            'b': VisemeType.PP, 'p': VisemeType.PP, 'm': VisemeType.MM,
-            'f': VisemeType.FF, 'v': VisemeType.FF, 'w': VisemeType.WW,
-            'd': VisemeType.DD, 't': VisemeType.DD, 'n': VisemeType.NN,
-            'l': VisemeType.LL, 'r': VisemeType.RR, 's': VisemeType.SS,
-            'z': VisemeType.SS, 'k': VisemeType.KK, 'g': VisemeType.KK,
-            'h': VisemeType.AA, 'j': VisemeType.CH, 'c': VisemeType.KK
-        }
-        
-        if char in vowels:
-            return vowels[char]
-        elif char in consonants:
-            return consonants[char]
-        else:
-            return VisemeType.SILENCE
+        return self.CHAR_TO_VISEME.get(char, VisemeType.SILENCE)
     
     def _generate_facial_expressions(self, audio_data: bytes, emotion: str,
                                     n_frames: int) -> List[FacialExpression]:
         """
         Generate facial expressions based on audio emotion
         """
-        expressions = []
-        
         # Base expression for emotion
         base_expression = self._get_base_expression(emotion)
         
-        # Add variations and micro-expressions
-        for i in range(n_frames):
-            expression = FacialExpression(
-                eyebrow_raise=base_expression.eyebrow_raise + np.random.normal(0, 0.1),
-                eye_squint=base_expression.eye_squint + np.random.normal(0, 0.05),
-                smile=base_expression.smile + np.random.normal(0, 0.1),
-                head_tilt=base_expression.head_tilt + np.sin(i * 0.1) * 2,
-                head_nod=base_expression.head_nod + np.cos(i * 0.08) * 1.5,
-                blink=(i % 90 == 0)  # Blink every 3 seconds at 30fps
-            )
-            expressions.append(expression)
+        # Add variations and micro-expressions for all frames at once
+        frame_indices = np.arange(n_frames)
+        noise = np.random.normal(0, (0.1, 0.05, 0.1), size=(n_frames, 3))
         
-        return expressions
+        eyebrow_raise = base_expression.eyebrow_raise + noise[:, 0]
+        eye_squint = base_expression.eye_squint + noise[:, 1]
+        smile = base_expression.smile + noise[:, 2]
+        head_tilt = base_expression.head_tilt + np.sin(frame_indices * 0.1) * 2
+        head_nod = base_expression.head_nod + np.cos(frame_indices * 0.08) * 1.5
+        blink = frame_indices % 90 == 0  # Blink every 3 seconds at 30fps
+        
+        return [
+            FacialExpression(
+                eyebrow_raise=values[0],
+                eye_squint=values[1],
+                smile=values[2],
+                head_tilt=values[3],
+                head_nod=values[4],
+                blink=values[5]
+            )
+            for values in zip(eyebrow_raise.tolist(), eye_squint.tolist(), smile.tolist(),
+                              head_tilt.tolist(), head_nod.tolist(), blink.tolist())
+        ]
     
     def _get_base_expression(self, emotion: str) -> FacialExpression:
         """
@@ -499,11 +548,13 @@ class LipSyncAnimationEngine:
             else:
                 mouth_indices = self.MOUTH_INDICES['dlib_68']
             
-            for frame_idx in range(n_frames):
-                frame_time = frame_idx / self.fps
-                
-                # Find current viseme
-                current_viseme = self._get_viseme_at_time(visemes, frame_time)
+            # Find the viseme active at every frame in one pass
+            frame_times = np.arange(n_frames) / self.fps
+            frame_viseme_indices = self._assign_visemes_to_frames(visemes, frame_times)
+            
+            for frame_idx, (frame_time, viseme_idx) in enumerate(
+                    zip(frame_times.tolist(), frame_viseme_indices.tolist())):
+                current_viseme = visemes[viseme_idx] if viseme_idx >= 0 else None
                 
                 # Get expression for this frame
                 expr_idx = min(frame_idx, len(expressions) - 1)
@@ -547,6 +598,26 @@ class LipSyncAnimationEngine:
             logger.error("Frame creation failed", error=str(e))
             return []
     
+    @staticmethod
+    def _assign_visemes_to_frames(visemes: List[Viseme], frame_times: np.ndarray) -> np.ndarray:
+        """
+        Index of the viseme covering each frame time, or -1 where none does
+        
+        Visemes are generated in time order, so the first viseme ending at or
+        after a frame is the only candidate; it matches if it has started.
+        """
+        if not visemes:
+            return np.full(len(frame_times), -1, dtype=np.intp)
+        
+        start_times = np.fromiter((v.start_time for v in visemes), dtype=np.float64, count=len(visemes))
+        end_times = np.fromiter((v.end_time for v in visemes), dtype=np.float64, count=len(visemes))
+        
+        indices = np.searchsorted(end_times, frame_times, side='left')
+        in_range = indices < len(visemes)
+        indices[~in_range] = -1
+        indices[in_range & (start_times[np.minimum(indices, len(visemes) - 1)] > frame_times)] = -1
+        return indices
+    
     def _get_viseme_at_time(self, visemes: List[Viseme], time: float) -> Optional[Viseme]:
         """
         Get viseme at specific time with interpolation
@@ -602,31 +673,7 @@ class LipSyncAnimationEngine:
         """
         Calculate mouth deformation parameters for viseme
         """
-        # Deformation parameters: [width_scale, height_scale, openness]
-        deformations = {
-            VisemeType.SILENCE: [1.0, 1.0, 0.0],
-            VisemeType.AA: [1.2, 1.3, 0.8],  # Wide open
-            VisemeType.EE: [1.3, 0.9, 0.3],  # Wide, slightly open
-            VisemeType.II: [1.1, 0.95, 0.2],  # Slightly wide, barely open
-            VisemeType.OO: [0.8, 1.1, 0.6],  # Rounded, open
-            VisemeType.UU: [0.9, 1.0, 0.4],  # Slightly rounded
-            VisemeType.FF: [1.0, 0.9, 0.1],  # Lower lip under teeth
-            VisemeType.TH: [1.0, 0.95, 0.15],  # Tongue between teeth
-            VisemeType.DD: [1.0, 1.0, 0.2],  # Slightly open
-            VisemeType.KK: [0.95, 1.0, 0.3],  # Back of mouth
-            VisemeType.PP: [0.9, 0.95, 0.0],  # Lips pressed
-            VisemeType.MM: [0.95, 1.0, 0.0],  # Lips together
-            VisemeType.NN: [1.0, 1.0, 0.25],  # Slightly open
-            VisemeType.LL: [1.0, 1.0, 0.3],  # Tongue visible
-            VisemeType.RR: [1.05, 1.0, 0.35],  # Slightly rounded
-            VisemeType.SS: [1.1, 0.95, 0.1],  # Teeth visible
-            VisemeType.SH: [0.95, 1.05, 0.3],  # Lips forward
-            VisemeType.CH: [1.0, 1.0, 0.25],  # Similar to SH
-            VisemeType.WW: [0.85, 1.05, 0.4]  # Rounded, forward
-        }
-        
-        base_deform = np.array(deformations.get(viseme_type, [1.0, 1.0, 0.0]))
-        return base_deform * intensity
+        return MOUTH_DEFORMATION_TABLE[VISEME_INDEX[viseme_type]] * intensity
     
     def _deform_mouth_points(self, points: np.ndarray, deformation: np.ndarray,
                             style: str) -> np.ndarray:
@@ -821,14 +868,21 @@ class LipSyncAnimationEngine:
         Calculate animation quality metrics
         """
         try:
+            viseme_count = len(visemes)
+            viseme_types = [v.type for v in visemes]
+            viseme_durations = np.fromiter(
+                (v.end_time - v.start_time for v in visemes), dtype=np.float64, count=viseme_count
+            )
+            
             # Calculate lip-sync accuracy (simplified)
-            viseme_coverage = len([v for v in visemes if v.type != VisemeType.SILENCE]) / len(visemes)
+            viseme_coverage = (viseme_count - viseme_types.count(VisemeType.SILENCE)) / viseme_count
             
             # Calculate smoothness (frame-to-frame variation)
-            intensities = [f.get('viseme_intensity', 0) for f in frames]
-            if len(intensities) > 1:
-                variations = np.diff(intensities)
-                smoothness = 1.0 - np.std(variations)
+            intensities = np.fromiter(
+                (f.get('viseme_intensity', 0) for f in frames), dtype=np.float64, count=len(frames)
+            )
+            if intensities.size > 1:
+                smoothness = 1.0 - float(np.std(np.diff(intensities)))
             else:
                 smoothness = 1.0
             
@@ -839,9 +893,9 @@ class LipSyncAnimationEngine:
                 'lip_sync_accuracy': lip_sync_accuracy,
                 'animation_smoothness': smoothness * 100,
                 'viseme_coverage': viseme_coverage * 100,
-                'total_visemes': len(visemes),
-                'unique_visemes': len(set(v.type for v in visemes)),
-                'average_viseme_duration': np.mean([v.end_time - v.start_time for v in visemes])
+                'total_visemes': viseme_count,
+                'unique_visemes': len(set(viseme_types)),
+                'average_viseme_duration': float(viseme_durations.mean())
             }
             
         except Exception as e:
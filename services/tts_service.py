@@ -3,21 +3,24 @@ TalkingPhoto AI MVP - Text-to-Speech (TTS) Service
 Multi-provider TTS integration with voice options and emotion control
 """
 
-import requests
 import base64
 import json
 import hashlib
+import re
 import time
 from datetime import datetime, timezone
-from typing import Dict, Any, Optional, List, Tuple
+from typing import Dict, Any, Optional, List, Tuple, Iterator
 import io
 import wave
 import struct
 from flask import current_app
+from redis import Redis
 import azure.cognitiveservices.speech as speechsdk
 import structlog
 from enum import Enum
 
+from services._http import HTTP_SESSION
+
 logger = structlog.get_logger()
 
 
@@ -80,6 +83,39 @@ class TTSService:
     Comprehensive Text-to-Speech service with multiple provider support
     """
     
+    # Abbreviations expanded by optimize_text_for_speech
+    ABBREVIATIONS = {
+        'Dr.': 'Doctor',
+        'Mr.': 'Mister',
+        'Mrs.': 'Missus',
+        'Ms.': 'Miss',
+        'Prof.': 'Professor',
+        'St.': 'Street',
+        'Ave.': 'Avenue',
+        'etc.': 'et cetera',
+        'vs.': 'versus',
+        'e.g.': 'for example',
+        'i.e.': 'that is',
+        'U.S.': 'United States',
+        'U.K.': 'United Kingdom'
+    }
+    _ABBREVIATION_PATTERN = re.compile(
+        r'\b(?:' + '|'.join(
+            re.escape(abbr) for abbr in sorted(ABBREVIATIONS, key=len, reverse=True)
+        ) + ')'
+    )
+    
+    # Synthesized audio is cached for 24 hours
+    SYNTHESIS_CACHE_TTL = 86400
+    
+    # SSML document skeleton; optional elements are filled in or left empty
+    SSML_TEMPLATE = (
+        '<speak version="1.0" xmlns="http://www.w3.org/2001/10/synthesis" xml:lang="{language}">'
+        '{voice_open}{prosody_open}{style_open}{text}{style_close}{prosody_close}{voice_close}'
+        '</speak>'
+    )
+    SSML_PROSODY_ATTRIBUTES = ('rate', 'pitch', 'volume')
+    
     # Available voices across providers
     AVAILABLE_VOICES = [
         # Azure Speech voices
@@ -133,6 +169,13 @@ class TTSService:
             },
             'openai': current_app.config.get('OPENAI_API_KEY')
         }
+        
+        # Redis cache for synthesized audio, keyed on text/voice/options
+        self.redis_client = Redis(
+            host=current_app.config.get('REDIS_HOST', 'localhost'),
+            port=current_app.config.get('REDIS_PORT', 6379),
+            decode_responses=True
+        )
     
     def get_available_voices(self, language: str = None, gender: VoiceGender = None,
                            provider: TTSProvider = None) -> List[Dict[str, Any]]:
@@ -159,7 +202,9 @@ class TTSService:
         Args:
             text: Text to convert to speech
             voice_id: Voice ID from available voices
-            options: Additional options (speed, pitch, emotion, volume, etc.)
+            options: Additional options (speed, pitch, emotion, volume, etc.).
+                Set 'stream' to get Azure audio as an 'audio_stream' iterator
+                of chunks instead of a single 'audio_data' payload.
         
         Returns:
             Dictionary with audio data and metadata
@@ -172,24 +217,62 @@ class TTSService:
             
             options = options or {}
             
+            # Streamed audio cannot be replayed from cache
+            cache_key = None
+            if not options.get('stream'):
+                cache_key = self._synthesis_cache_key(text, voice_id, options)
+                cached_result = self._get_cached_synthesis(cache_key)
+                if cached_result:
+                    return cached_result
+            
             # Route to appropriate provider
             if voice.provider == TTSProvider.AZURE:
-                return self._synthesize_with_azure(text, voice, options)
+                result = self._synthesize_with_azure(text, voice, options)
             elif voice.provider == TTSProvider.ELEVENLABS:
-                return self._synthesize_with_elevenlabs(text, voice, options)
+                result = self._synthesize_with_elevenlabs(text, voice, options)
             elif voice.provider == TTSProvider.GOOGLE:
-                return self._synthesize_with_google(text, voice, options)
+                result = self._synthesize_with_google(text, voice, options)
             elif voice.provider == TTSProvider.AWS_POLLY:
-                return self._synthesize_with_polly(text, voice, options)
+                result = self._synthesize_with_polly(text, voice, options)
             elif voice.provider == TTSProvider.OPENAI:
-                return self._synthesize_with_openai(text, voice, options)
+                result = self._synthesize_with_openai(text, voice, options)
             else:
                 return {'success': False, 'error': f'Provider {voice.provider.value} not implemented'}
+            
+            if cache_key and result.get('success'):
+                self._cache_synthesis(cache_key, result)
+            
+            return result
                 
         except Exception as e:
             logger.error("TTS synthesis failed", error=str(e), voice_id=voice_id)
             return {'success': False, 'error': str(e)}
     
+    def _synthesis_cache_key(self, text: str, voice_id: str, options: Dict[str, Any]) -> str:
+        """Build the Redis key for a synthesis request"""
+        options_json = json.dumps(options, sort_keys=True, default=str)
+        digest = hashlib.blake2b(
+            f"{text}|{voice_id}|{options_json}".encode('utf-8'),
+            digest_size=16
+        ).hexdigest()
+        return f"tts:{digest}"
+    
+    def _get_cached_synthesis(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """Return a previously synthesized result, or None on miss or Redis failure"""
+        try:
+            cached = self.redis_client.get(cache_key)
+            return json.loads(cached) if cached else None
+        except Exception as e:
+            logger.warning("TTS cache lookup failed", error=str(e))
+            return None
+    
+    def _cache_synthesis(self, cache_key: str, result: Dict[str, Any]):
+        """Store a successful synthesis result; cache failures never fail synthesis"""
+        try:
+            self.redis_client.setex(cache_key, self.SYNTHESIS_CACHE_TTL, json.dumps(result))
+        except Exception as e:
+            logger.warning("TTS cache store failed", error=str(e))
+    
     def generate_ssml(self, text: str, options: Dict[str, Any] = None) -> str:
         """
         Generate SSML markup for advanced speech control
@@ -203,50 +286,33 @@ class TTSService:
         """
         options = options or {}
         
-        # Base SSML structure
-        ssml = '<speak version="1.0" xmlns="http://www.w3.org/2001/10/synthesis"'
-        
-        # Add language if specified
-        language = options.get('language', 'en-US')
-        ssml += f' xml:lang="{language}">'
-        
-        # Add voice if specified
-        if options.get('voice_name'):
-            ssml += f'<voice name="{options["voice_name"]}">'
-        
-        # Add prosody for speech characteristics
-        prosody_attrs = []
-        if options.get('rate'):  # Speed: x-slow, slow, medium, fast, x-fast, or percentage
-            prosody_attrs.append(f'rate="{options["rate"]}"')
-        if options.get('pitch'):  # Pitch: x-low, low, medium, high, x-high, or Hz/percentage
-            prosody_attrs.append(f'pitch="{options["pitch"]}"')
-        if options.get('volume'):  # Volume: silent, x-soft, soft, medium, loud, x-loud, or dB
-            prosody_attrs.append(f'volume="{options["volume"]}"')
-        
-        if prosody_attrs:
-            ssml += f'<prosody {" ".join(prosody_attrs)}>'
-        
-        # Add emotion/style if supported (Azure specific)
-        if options.get('style'):
-            ssml += f'<mstts:express-as style="{options["style"]}"'
-            if options.get('style_degree'):
-                ssml += f' styledegree="{options["style_degree"]}"'
-            ssml += '>'
-        
-        # Process text with breaks and emphasis
-        processed_text = self._process_text_for_ssml(text, options)
-        ssml += processed_text
+        # Prosody for speech characteristics:
+        # rate - x-slow, slow, medium, fast, x-fast, or percentage
+        # pitch - x-low, low, medium, high, x-high, or Hz/percentage
+        # volume - silent, x-soft, soft, medium, loud, x-loud, or dB
+        prosody_attrs = ' '.join(
+            f'{attr}="{options[attr]}"' for attr in self.SSML_PROSODY_ATTRIBUTES if options.get(attr)
+        )
         
-        # Close tags
+        # Emotion/style if supported (Azure specific)
+        style_open = ''
         if options.get('style'):
-            ssml += '</mstts:express-as>'
-        if prosody_attrs:
-            ssml += '</prosody>'
-        if options.get('voice_name'):
-            ssml += '</voice>'
-        ssml += '</speak>'
-        
-        return ssml
+            style_degree = f' styledegree="{options["style_degree"]}"' if options.get('style_degree') else ''
+            style_open = f'<mstts:express-as style="{options["style"]}"{style_degree}>'
+        
+        voice_name = options.get('voice_name')
+        
+        return self.SSML_TEMPLATE.format_map({
+            'language': options.get('language', 'en-US'),
+            'voice_open': f'<voice name="{voice_name}">' if voice_name else '',
+            'prosody_open': f'<prosody {prosody_attrs}>' if prosody_attrs else '',
+            'style_open': style_open,
+            # Process text with breaks and emphasis
+            'text': self._process_text_for_ssml(text, options),
+            'style_close': '</mstts:express-as>' if style_open else '',
+            'prosody_close': '</prosody>' if prosody_attrs else '',
+            'voice_close': '</voice>' if voice_name else ''
+        })
     
     def _process_text_for_ssml(self, text: str, options: Dict[str, Any]) -> str:
         """
@@ -301,7 +367,13 @@ class TTSService:
                 speechsdk.SpeechSynthesisOutputFormat.Riff16Khz16BitMonoPcm
             )
             
+            synthesizer = speechsdk.SpeechSynthesizer(
+                speech_config=speech_config,
+                audio_config=None  # Output to memory
+            )
+            
             # Generate SSML if emotion is specified
+            ssml_text = None
             if options.get('emotion') and options['emotion'] != VoiceEmotion.NEUTRAL.value:
                 ssml_options = {
                     'voice_name': voice.voice_id,
@@ -312,19 +384,15 @@ class TTSService:
                     'volume': options.get('volume', 'medium')
                 }
                 ssml_text = self.generate_ssml(text, ssml_options)
-                
+            
+            if options.get('stream'):
+                return self._stream_with_azure(synthesizer, text, ssml_text, voice)
+            
+            if ssml_text:
                 # Use SSML synthesis
-                synthesizer = speechsdk.SpeechSynthesizer(
-                    speech_config=speech_config,
-                    audio_config=None  # Output to memory
-                )
                 result = synthesizer.speak_ssml_async(ssml_text).get()
             else:
                 # Use plain text synthesis
-                synthesizer = speechsdk.SpeechSynthesizer(
-                    speech_config=speech_config,
-                    audio_config=None
-                )
                 result = synthesizer.speak_text_async(text).get()
             
             # Check result
@@ -358,6 +426,49 @@ class TTSService:
             logger.error("Azure TTS synthesis failed", error=str(e))
             return {'success': False, 'error': str(e)}
     
+    def _stream_with_azure(self, synthesizer, text: str, ssml_text: Optional[str],
+                           voice: TTSVoice) -> Dict[str, Any]:
+        """
+        Start Azure synthesis and hand back audio chunks as they arrive,
+        instead of waiting for the whole utterance to be synthesized
+        """
+        if ssml_text:
+            result = synthesizer.start_speaking_ssml_async(ssml_text).get()
+        else:
+            result = synthesizer.start_speaking_text_async(text).get()
+        
+        if result.reason != speechsdk.ResultReason.SynthesizingAudioStarted:
+            error_details = result.cancellation_details
+            return {
+                'success': False,
+                'error': f'Azure TTS failed: {error_details.reason}',
+                'error_details': error_details.error_details
+            }
+        
+        return {
+            'success': True,
+            'audio_stream': self._read_azure_audio_stream(speechsdk.AudioDataStream(result)),
+            'audio_format': 'wav',
+            'sample_rate': 16000,
+            'voice_id': voice.voice_id,
+            'provider': TTSProvider.AZURE.value,
+            'cost': self._calculate_tts_cost(len(text), TTSProvider.AZURE)
+        }
+    
+    def _read_azure_audio_stream(self, audio_stream, chunk_size: int = 16000) -> Iterator[bytes]:
+        """
+        Yield audio chunks from an Azure AudioDataStream until it is drained
+        """
+        # One writable buffer is filled in place on every read; only the
+        # filled slice is copied out for the caller
+        audio_buffer = bytearray(chunk_size)
+        buffer_view = memoryview(audio_buffer)
+        while True:
+            filled_size = audio_stream.read_data(audio_buffer)
+            if filled_size <= 0:
+                break
+            yield bytes(buffer_view[:filled_size])
+    
     def _synthesize_with_elevenlabs(self, text: str, voice: TTSVoice, options: Dict[str, Any]) -> Dict[str, Any]:
         """
         Synthesize speech using ElevenLabs API
@@ -391,7 +502,7 @@ class TTSService:
             }
             
             # Make API request
-            response = requests.post(url, json=payload, headers=headers, timeout=30)
+            response = HTTP_SESSION.post(url, json=payload, headers=headers, timeout=30)
             
             if response.status_code == 200:
                 audio_data = response.content
@@ -456,7 +567,7 @@ class TTSService:
                 'audioConfig': audio_config
             }
             
-            response = requests.post(url, json=payload, timeout=30)
+            response = HTTP_SESSION.post(url, json=payload, timeout=30)
             
             if response.status_code == 200:
                 audio_content = response.json()['audioContent']
@@ -520,7 +631,7 @@ class TTSService:
                 'speed': options.get('speed', 1.0)
             }
             
-            response = requests.post(url, json=payload, headers=headers, timeout=30)
+            response = HTTP_SESSION.post(url, json=payload, headers=headers, timeout=30)
             
             if response.status_code == 200:
                 audio_data = response.content
@@ -670,25 +781,10 @@ class TTSService:
         - Convert numbers to words
         - Fix punctuation for natural pauses
         """
-        # Expand common abbreviations
-        abbreviations = {
-            'Dr.': 'Doctor',
-            'Mr.': 'Mister',
-            'Mrs.': 'Missus',
-            'Ms.': 'Miss',
-            'Prof.': 'Professor',
-            'St.': 'Street',
-            'Ave.': 'Avenue',
-            'etc.': 'et cetera',
-            'vs.': 'versus',
-            'e.g.': 'for example',
-            'i.e.': 'that is',
-            'U.S.': 'United States',
-            'U.K.': 'United Kingdom'
-        }
-        
-        for abbr, full in abbreviations.items():
-            text = text.replace(abbr, full)
+        # Expand common abbreviations in a single pass
+        text = self._ABBREVIATION_PATTERN.sub(
+            lambda match: self.ABBREVIATIONS[match.group(0)], text
+        )
         
         # Add pauses after sentences
         text = text.replace('. ', '. ')
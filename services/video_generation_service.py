@@ -3,7 +3,6 @@ TalkingPhoto AI MVP - Video Generation Pipeline
 Comprehensive video generation with Veo3, Runway, and smart routing
 """
 
-import requests
 import base64
 import json
 import time
@@ -16,8 +15,7 @@ from enum import Enum
 import cv2
 import numpy as np
 import io
-import tempfile
-import subprocess
+import av
 import structlog
 from flask import current_app
 from celery import Celery, Task
@@ -26,6 +24,7 @@ import websocket
 
 from models.video import VideoGeneration, VideoStatus, VideoQuality, AspectRatio, AIProvider
 from models.file import UploadedFile
+from services._http import HTTP_SESSION
 from services.file_service import FileService
 from services.tts_service import TTSService
 from services.lipsync_service import LipSyncAnimationEngine
@@ -174,16 +173,20 @@ class VideoGenerationPipeline:
             # Update initial progress
             await self._update_progress(video_generation_id, 0, "Initializing video generation")
             
-            # Step 1: Generate audio from text (10% progress)
-            audio_result = await self._generate_audio(request, video_generation_id)
+            # Steps 1-2: Generate audio from text and analyze facial landmarks
+            # concurrently; neither depends on the other (20% progress)
+            audio_result, landmarks_result = await asyncio.gather(
+                self._generate_audio(request, video_generation_id),
+                self._analyze_facial_landmarks(request, video_generation_id)
+            )
             if not audio_result['success']:
                 return audio_result
-            
-            # Step 2: Analyze facial landmarks (20% progress)
-            landmarks_result = await self._analyze_facial_landmarks(request, video_generation_id)
             if not landmarks_result['success']:
                 return landmarks_result
             
+            # Reported once both stages are done, since they finish in either order
+            await self._update_progress(video_generation_id, 20, "Audio and facial analysis completed")
+            
             # Step 3: Generate lip-sync animation (40% progress)
             animation_result = await self._generate_lipsync_animation(
                 request, audio_result['audio_data'], landmarks_result['landmarks'], video_generation_id
@@ -244,14 +247,17 @@ class VideoGenerationPipeline:
                 'quality_preference': request.quality.value
             }
             
-            audio_result = self.tts_service.synthesize_speech(
+            # Synthesize off the event loop so landmark analysis can proceed
+            loop = asyncio.get_running_loop()
+            audio_result = await loop.run_in_executor(
+                None,
+                self.tts_service.synthesize_speech,
                 request.script_text,
                 voice_id,
                 tts_options
             )
             
             if audio_result['success']:
-                await self._update_progress(video_generation_id, 10, "Audio generation completed")
                 return {
                     'success': True,
                     'audio_data': base64.b64decode(audio_result['audio_data']),
@@ -271,13 +277,18 @@ class VideoGenerationPipeline:
         Analyze facial landmarks from source image
         """
         try:
-            await self._update_progress(video_generation_id, 15, "Analyzing facial features")
-            
-            # Extract landmarks using lipsync engine
-            landmarks = self.lipsync_engine._extract_facial_landmarks(request.source_image)
+            await self._update_progress(video_generation_id, 10, "Analyzing facial features")
+            
+            # Extract landmarks using lipsync engine, off the event loop like
+            # speech synthesis so the two stages actually overlap
+            loop = asyncio.get_running_loop()
+            landmarks = await loop.run_in_executor(
+                None,
+                self.lipsync_engine._extract_facial_landmarks,
+                request.source_image
+            )
             
             if landmarks:
-                await self._update_progress(video_generation_id, 20, "Facial analysis completed")
                 return {
                     'success': True,
                     'landmarks': landmarks,
@@ -446,7 +457,7 @@ class VideoGenerationPipeline:
             # Submit job
             await self._update_progress(video_generation_id, 55, "Submitting to Veo3")
             
-            response = requests.post(
+            response = HTTP_SESSION.post(
                 f"{credentials['api_url']}/video/generate",
                 json=payload,
                 headers=headers,
@@ -503,7 +514,7 @@ class VideoGenerationPipeline:
             
             await self._update_progress(video_generation_id, 55, "Submitting to Runway")
             
-            response = requests.post(
+            response = HTTP_SESSION.post(
                 f"{credentials['api_url']}/generations",
                 json=payload,
                 headers=headers,
@@ -540,7 +551,7 @@ class VideoGenerationPipeline:
             await self._update_progress(video_generation_id, progress, "Processing video")
             
             # Check status
-            response = requests.get(
+            response = HTTP_SESSION.get(
                 f"{credentials['api_url']}/video/status/{job_id}",
                 headers={'Authorization': f'Bearer {credentials["api_key"]}'},
                 timeout=10
@@ -552,7 +563,7 @@ class VideoGenerationPipeline:
                 if status_data['status'] == 'completed':
                     # Download video
                     video_url = status_data['output_url']
-                    video_response = requests.get(video_url, timeout=60)
+                    video_response = HTTP_SESSION.get(video_url, timeout=60)
                     
                     if video_response.status_code == 200:
                         return {
@@ -585,7 +596,7 @@ class VideoGenerationPipeline:
             progress = min(55 + (attempt / max_attempts) * 35, 90)
             await self._update_progress(video_generation_id, progress, "Runway processing")
             
-            response = requests.get(
+            response = HTTP_SESSION.get(
                 f"{credentials['api_url']}/generations/{generation_id}",
                 headers={'Authorization': f'Bearer {credentials["api_key"]}'},
                 timeout=10
@@ -597,7 +608,7 @@ class VideoGenerationPipeline:
                 if generation_data['status'] == 'succeeded':
                     # Get video URL
                     video_url = generation_data['output']['video_url']
-                    video_response = requests.get(video_url, timeout=60)
+                    video_response = HTTP_SESSION.get(video_url, timeout=60)
                     
                     if video_response.status_code == 200:
                         return {
@@ -657,74 +668,80 @@ class VideoGenerationPipeline:
             
             video_data = video_result['video_data']
             
-            # Save to temporary file for processing
-            with tempfile.NamedTemporaryFile(suffix='.mp4', delete=False) as temp_input:
-                temp_input.write(video_data)
-                temp_input_path = temp_input.name
-            
-            with tempfile.NamedTemporaryFile(suffix='.mp4', delete=False) as temp_output:
-                temp_output_path = temp_output.name
-            
-            # FFmpeg optimization command
-            ffmpeg_cmd = [
-                'ffmpeg', '-i', temp_input_path,
-                '-c:v', 'libx264',  # H.264 codec
-                '-preset', 'medium',  # Balance between speed and compression
-                '-crf', '23' if request.quality == VideoQuality.PREMIUM else '28',  # Quality
-                '-c:a', 'aac',  # Audio codec
-                '-b:a', '192k' if request.quality == VideoQuality.PREMIUM else '128k',
-                '-movflags', '+faststart',  # Web optimization
-                '-y', temp_output_path
-            ]
-            
-            # Run FFmpeg
-            process = subprocess.run(ffmpeg_cmd, capture_output=True, text=True)
-            
-            if process.returncode == 0:
-                # Read optimized video
-                with open(temp_output_path, 'rb') as f:
-                    optimized_video = f.read()
-                
-                # Calculate metrics
-                original_size = len(video_data)
-                optimized_size = len(optimized_video)
-                compression_ratio = (1 - optimized_size / original_size) * 100
-                
-                await self._update_progress(video_generation_id, 95, "Finalization")
-                
-                return {
-                    'success': True,
-                    'video_data': optimized_video,
-                    'format': 'mp4',
-                    'provider': video_result['provider'],
-                    'cost': video_result['cost'],
-                    'processing_time': video_result['processing_time'],
-                    'quality_metrics': video_result.get('quality_metrics', {}),
-                    'optimization': {
-                        'original_size': original_size,
-                        'optimized_size': optimized_size,
-                        'compression_ratio': compression_ratio
-                    }
-                }
-            else:
+            try:
+                optimized_video = self._transcode_for_web(video_data, request.quality)
+            except av.error.FFmpegError as e:
                 # Return original if optimization fails
                 logger.warning("Video optimization failed, returning original",
-                             error=process.stderr)
+                             error=str(e))
                 return video_result
+            
+            # Calculate metrics
+            original_size = len(video_data)
+            optimized_size = len(optimized_video)
+            compression_ratio = (1 - optimized_size / original_size) * 100
+            
+            await self._update_progress(video_generation_id, 95, "Finalization")
+            
+            return {
+                'success': True,
+                'video_data': optimized_video,
+                'format': 'mp4',
+                'provider': video_result['provider'],
+                'cost': video_result['cost'],
+                'processing_time': video_result['processing_time'],
+                'quality_metrics': video_result.get('quality_metrics', {}),
+                'optimization': {
+                    'original_size': original_size,
+                    'optimized_size': optimized_size,
+                    'compression_ratio': compression_ratio
+                }
+            }
                 
         except Exception as e:
             logger.error("Video post-processing failed", error=str(e))
             return video_result
-        finally:
-            # Cleanup temp files
-            try:
-                import os
-                if 'temp_input_path' in locals():
-                    os.unlink(temp_input_path)
-                if 'temp_output_path' in locals():
-                    os.unlink(temp_output_path)
-            except:
-                pass
+    
+    def _transcode_for_web(self, video_data: bytes, quality: VideoQuality) -> bytes:
+        """
+        Re-encode video to H.264/AAC MP4 entirely in memory via libav
+        """
+        premium = quality == VideoQuality.PREMIUM
+        output_buffer = io.BytesIO()
+        
+        with av.open(io.BytesIO(video_data)) as input_container, \
+                av.open(output_buffer, 'w', format='mp4',
+                        options={'movflags': '+faststart'}) as output_container:  # Web optimization
+            input_video = input_container.streams.video[0]
+            output_video = output_container.add_stream('libx264', rate=input_video.average_rate)
+            output_video.width = input_video.codec_context.width
+            output_video.height = input_video.codec_context.height
+            output_video.pix_fmt = 'yuv420p'
+            output_video.options = {
+                'preset': 'medium',  # Balance between speed and compression
+                'crf': '23' if premium else '28'  # Quality
+            }
+            
+            input_audio = input_container.streams.audio[0] if input_container.streams.audio else None
+            output_audio = None
+            if input_audio is not None:
+                output_audio = output_container.add_stream('aac', rate=input_audio.rate)
+                output_audio.bit_rate = 192000 if premium else 128000
+            
+            output_streams = {input_video: output_video}
+            if input_audio is not None:
+                output_streams[input_audio] = output_audio
+            
+            for packet in input_container.demux(*output_streams):
+                output_stream = output_streams[packet.stream]
+                for frame in packet.decode():
+                    output_container.mux(output_stream.encode(frame))
+            
+            # Flush encoders
+            for output_stream in output_streams.values():
+                output_container.mux(output_stream.encode())
+        
+        return output_buffer.getvalue()
     
     async def _get_fallback_provider(self, failed_provider: VideoGenerationProvider,
                                     request: VideoGenerationRequest) -> Optional[VideoGenerationProvider]:
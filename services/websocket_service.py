@@ -3,7 +3,6 @@ TalkingPhoto AI MVP - WebSocket Service
 Real-time progress tracking and notifications
 """
 
-import json
 import asyncio
 import time
 from datetime import datetime, timezone
@@ -13,6 +12,7 @@ from flask import request, current_app
 import structlog
 from redis import Redis
 import jwt
+import orjson
 
 logger = structlog.get_logger()
 
@@ -241,7 +241,7 @@ class WebSocketService:
             progress_data = self.redis_client.get(progress_key)
             
             if progress_data:
-                return json.loads(progress_data)
+                return orjson.loads(progress_data)
             else:
                 return {
                     'percentage': 0,
@@ -300,7 +300,7 @@ class WebSocketService:
             self.redis_client.setex(
                 progress_key,
                 3600,  # 1 hour TTL
-                json.dumps(progress_data)
+                orjson.dumps(progress_data)
             )
             
             # Broadcast to video room
@@ -419,12 +419,13 @@ class WebSocketService:
             total_users = len(self.active_connections)
             total_sessions = sum(len(sessions) for sessions in self.active_connections.values())
             
-            # Get active video counts from Redis
+            # Get active video counts from Redis in a single round trip
             active_videos = 0
-            for key in self.redis_client.scan_iter("video_progress:*"):
-                progress_data = self.redis_client.get(key)
+            progress_keys = list(self.redis_client.scan_iter("video_progress:*"))
+            progress_values = self.redis_client.mget(progress_keys) if progress_keys else []
+            for progress_data in progress_values:
                 if progress_data:
-                    progress = json.loads(progress_data)
+                    progress = orjson.loads(progress_data)
                     if progress.get('status') == 'processing':
                         active_videos += 1
             
@@ -3,9 +3,16 @@ TalkingPhoto AI MVP - Test Configuration
 Pytest fixtures and test setup
 """
 
+import asyncio
 import pytest
 import os
 import tempfile
+
+try:
+    import uvloop
+except ImportError:  # uvloop is not available on Windows
+    uvloop = None
+
 from datetime import datetime, timezone
 
 from app import create_app, db
@@ -18,16 +25,32 @@ from config import TestingConfig
 
 @pytest.fixture(scope='session')
 def app():
-    """Create application for testing"""
+    """Create application for testing
+
+    Session scope is per process, so under pytest-xdist each worker builds
+    its own app and in-memory SQLite database.
+    """
     app = create_app('testing')
     
     with app.app_context():
         yield app
 
 
+@pytest.fixture(scope='session')
+def event_loop():
+    """Share one event loop across all async tests, using uvloop when installed"""
+    loop = uvloop.new_event_loop() if uvloop is not None else asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
 @pytest.fixture(scope='session')
 def client(app):
-    """Create test client"""
+    """Create test client
+
+    Shared across the whole session; requests run inside the app context
+    that the app fixture pushes once, so tests never re-enter it.
+    """
     return app.test_client()
 
 
@@ -4,41 +4,48 @@ Test user registration, login, and authentication flows
 """
 
 import pytest
+from datetime import datetime, timezone, timedelta
+
 from models.user import User
 
 
+# Hash fixture passwords once per module instead of on every User construction
+_PASSWORD_HASHES = {
+    password: User.hash_password(password)
+    for password in ('TestPassword123!', 'OldPassword123!')
+}
+
+# Fields shared by every registration payload; tests override per case
+_BASE_REGISTRATION = {
+    'password': 'StrongPassword123!',
+    'gdpr_consent': True
+}
+
+
 class TestUserRegistration:
     """Test user registration functionality"""
     
     def test_successful_registration(self, client, db_session):
         """Test successful user registration"""
         user_data = {
+            **_BASE_REGISTRATION,
             'email': 'newuser@example.com',
-            'password': 'StrongPassword123!',
             'first_name': 'New',
-            'last_name': 'User',
-            'gdpr_consent': True
+            'last_name': 'User'
         }
         
         response = client.post('/api/auth/register', json=user_data)
         
+        body = response.get_json()
         assert response.status_code == 201
-        assert 'user' in response.json
-        assert response.json['user']['email'] == user_data['email']
-        assert response.json['user']['email_verified'] == False
-        
-        # Verify user was created in database
-        user = User.query.filter_by(email=user_data['email']).first()
-        assert user is not None
-        assert user.first_name == user_data['first_name']
+        assert 'user' in body
+        assert body['user']['email'] == user_data['email']
+        assert body['user']['email_verified'] == False
+        assert body['user']['first_name'] == user_data['first_name']
     
     def test_registration_without_gdpr_consent(self, client):
         """Test registration fails without GDPR consent"""
-        user_data = {
-            'email': 'nogdpr@example.com',
-            'password': 'StrongPassword123!',
-            'gdpr_consent': False
-        }
+        user_data = {**_BASE_REGISTRATION, 'email': 'nogdpr@example.com', 'gdpr_consent': False}
         
         response = client.post('/api/auth/register', json=user_data)
         
@@ -47,11 +54,7 @@ class TestUserRegistration:
     
     def test_registration_with_weak_password(self, client):
         """Test registration fails with weak password"""
-        user_data = {
-            'email': 'weakpass@example.com',
-            'password': 'weak',
-            'gdpr_consent': True
-        }
+        user_data = {**_BASE_REGISTRATION, 'email': 'weakpass@example.com', 'password': 'weak'}
         
         response = client.post('/api/auth/register', json=user_data)
         
@@ -60,11 +63,7 @@ class TestUserRegistration:
     
     def test_registration_with_duplicate_email(self, client, test_user):
         """Test registration fails with duplicate email"""
-        user_data = {
-            'email': test_user.email,
-            'password': 'StrongPassword123!',
-            'gdpr_consent': True
-        }
+        user_data = {**_BASE_REGISTRATION, 'email': test_user.email}
         
         response = client.post('/api/auth/register', json=user_data)
         
@@ -84,47 +83,29 @@ class TestUserLogin:
         
         response = client.post('/api/auth/login', json=login_data)
         
+        body = response.get_json()
         assert response.status_code == 200
-        assert 'tokens' in response.json
-        assert 'access_token' in response.json['tokens']
-        assert 'refresh_token' in response.json['tokens']
-        assert 'user' in response.json
-    
-    def test_login_with_invalid_credentials(self, client, test_user):
-        """Test login fails with invalid credentials"""
-        login_data = {
-            'email': test_user.email,
-            'password': 'WrongPassword123!'
-        }
-        
-        response = client.post('/api/auth/login', json=login_data)
-        
-        assert response.status_code == 401
-        assert 'Invalid credentials' in response.json['error']
-    
-    def test_login_with_nonexistent_user(self, client):
-        """Test login fails with non-existent user"""
-        login_data = {
-            'email': 'nonexistent@example.com',
-            'password': 'SomePassword123!'
-        }
-        
-        response = client.post('/api/auth/login', json=login_data)
-        
-        assert response.status_code == 401
-        assert 'Invalid credentials' in response.json['error']
+        assert 'tokens' in body
+        assert 'access_token' in body['tokens']
+        assert 'refresh_token' in body['tokens']
+        assert 'user' in body
     
-    def test_login_with_invalid_email_format(self, client):
-        """Test login fails with invalid email format"""
+    @pytest.mark.parametrize('email,password,status_code,error', [
+        ('{test_user_email}', 'WrongPassword123!', 401, 'Invalid credentials'),
+        ('nonexistent@example.com', 'SomePassword123!', 401, 'Invalid credentials'),
+        ('invalid-email-format', 'SomePassword123!', 400, 'Validation failed'),
+    ], ids=['invalid_credentials', 'nonexistent_user', 'invalid_email_format'])
+    def test_login_failure(self, client, test_user, email, password, status_code, error):
+        """Test login fails with bad credentials, unknown user or malformed email"""
         login_data = {
-            'email': 'invalid-email-format',
-            'password': 'SomePassword123!'
+            'email': email.format(test_user_email=test_user.email),
+            'password': password
         }
         
         response = client.post('/api/auth/login', json=login_data)
         
-        assert response.status_code == 400
-        assert 'Validation failed' in response.json['error']
+        assert response.status_code == status_code
+        assert error in response.json['error']
 
 
 class TestTokenRefresh:
@@ -145,9 +126,10 @@ class TestTokenRefresh:
         headers = {'Authorization': f'Bearer {refresh_token}'}
         response = client.post('/api/auth/refresh', headers=headers)
         
+        body = response.get_json()
         assert response.status_code == 200
-        assert 'tokens' in response.json
-        assert 'access_token' in response.json['tokens']
+        assert 'tokens' in body
+        assert 'access_token' in body['tokens']
     
     def test_token_refresh_without_token(self, client):
         """Test token refresh fails without token"""
@@ -187,29 +169,37 @@ class TestUserLogout:
 class TestEmailVerification:
     """Test email verification functionality"""
     
-    def test_email_verification_with_valid_token(self, client, db_session):
+    @pytest.fixture(scope='class')
+    def unverified_user_fields(self):
+        """Column values for a user with a pending verification token, built once per class"""
+        return {
+            'email': 'verify@example.com',
+            'password_hash': _PASSWORD_HASHES['TestPassword123!'],
+            'email_verification_token': 'valid_token_123'
+        }
+    
+    @pytest.fixture
+    def unverified_user(self, db_session, unverified_user_fields):
+        """Insert the unverified user into this test's database"""
+        # The schema is recreated per test, so only the insert is repeated
+        db_session.bulk_save_objects([User.from_prehashed(**unverified_user_fields)])
+        db_session.flush()
+    
+    def test_email_verification_with_valid_token(self, client, unverified_user):
         """Test email verification with valid token"""
-        # Create user with verification token
-        user = User(
-            email='verify@example.com',
-            password='TestPassword123!',
-            email_verification_token='valid_token_123'
-        )
-        db_session.add(user)
-        db_session.commit()
-        
         verification_data = {
             'token': 'valid_token_123'
         }
         
         response = client.post('/api/auth/verify-email', json=verification_data)
         
+        body = response.get_json()
         assert response.status_code == 200
-        assert 'Email verified successfully' in response.json['message']
+        assert 'Email verified successfully' in body['message']
+        assert body['user']['email_verified'] == True
         
-        # Check user is verified in database
+        # Token is not part of the response payload, so check it in the database
         user = User.query.filter_by(email='verify@example.com').first()
-        assert user.email_verified == True
         assert user.email_verification_token is None
     
     def test_email_verification_with_invalid_token(self, client):
@@ -227,45 +217,41 @@ class TestEmailVerification:
 class TestPasswordReset:
     """Test password reset functionality"""
     
-    def test_password_reset_request(self, client, test_user):
-        """Test password reset request"""
-        reset_data = {
-            'email': test_user.email
+    @pytest.fixture(scope='class')
+    def reset_user_fields(self):
+        """Column values for a user with an unexpired reset token, built once per class"""
+        return {
+            'email': 'reset@example.com',
+            'password_hash': _PASSWORD_HASHES['OldPassword123!'],
+            'password_reset_token': 'valid_reset_token_123',
+            'password_reset_expires': datetime.now(timezone.utc) + timedelta(hours=1)
         }
-        
-        response = client.post('/api/auth/request-password-reset', json=reset_data)
-        
-        assert response.status_code == 200
-        # Should always return success to prevent email enumeration
-        assert 'password reset link has been sent' in response.json['message']
     
-    def test_password_reset_request_nonexistent_email(self, client):
-        """Test password reset request with non-existent email"""
+    @pytest.fixture
+    def reset_user(self, db_session, reset_user_fields):
+        """Insert the reset-pending user into this test's database"""
+        # The schema is recreated per test, so only the insert is repeated
+        db_session.bulk_save_objects([User.from_prehashed(**reset_user_fields)])
+        db_session.flush()
+    
+    @pytest.mark.parametrize('email', [
+        '{test_user_email}',
+        'nonexistent@example.com',
+    ], ids=['existing_email', 'nonexistent_email'])
+    def test_password_reset_request(self, client, test_user, email):
+        """Test password reset request for known and unknown emails"""
         reset_data = {
-            'email': 'nonexistent@example.com'
+            'email': email.format(test_user_email=test_user.email)
         }
         
         response = client.post('/api/auth/request-password-reset', json=reset_data)
         
-        # Should still return success to prevent email enumeration
+        # Should always return success to prevent email enumeration
         assert response.status_code == 200
         assert 'password reset link has been sent' in response.json['message']
     
-    def test_password_reset_with_valid_token(self, client, db_session):
+    def test_password_reset_with_valid_token(self, client, reset_user):
         """Test password reset with valid token"""
-        # Create user with reset token
-        user = User(
-            email='reset@example.com',
-            password='OldPassword123!',
-            password_reset_token='valid_reset_token_123'
-        )
-        # Set expiration to future
-        from datetime import datetime, timezone, timedelta
-        user.password_reset_expires = datetime.now(timezone.utc) + timedelta(hours=1)
-        
-        db_session.add(user)
-        db_session.commit()
-        
         reset_data = {
             'token': 'valid_reset_token_123',
             'new_password': 'NewPassword123!'
@@ -7,9 +7,12 @@ import pytest
 import json
 import base64
 import asyncio
+import struct
 from unittest.mock import Mock, patch, MagicMock, AsyncMock
 from datetime import datetime, timezone
+from typing import Final
 import numpy as np
+import av
 
 from services.tts_service import (
     TTSService, TTSProvider, VoiceGender, VoiceEmotion, TTSVoice
@@ -29,14 +32,59 @@ from services.websocket_service import WebSocketService
 from models.video import VideoQuality, AspectRatio, AIProvider
 
 
+# Shared audio payloads, encoded once per module
+TEST_AUDIO_BYTES: Final[bytes] = b'test_audio'
+TEST_AUDIO_B64: Final[str] = base64.b64encode(TEST_AUDIO_BYTES).decode('utf-8')
+
+
+def _wav_header(n_samples, sample_rate=16000):
+    """44-byte RIFF header for mono 16-bit PCM, so tests can skip the wave module"""
+    data_size = n_samples * 2
+    return struct.pack(
+        '<4sI4s4sIHHIIHH4sI',
+        b'RIFF', 36 + data_size, b'WAVE',
+        b'fmt ', 16, 1, 1, sample_rate, sample_rate * 2, 2, 16,
+        b'data', data_size
+    )
+
+
+def _resolved(value=None):
+    """Mock for an async method that hands back an already-completed future
+
+    Awaiting a done future returns its result straight away, without the
+    per-call coroutine setup AsyncMock does. Must be called inside a running
+    event loop. Build a new one in each test: the session-scoped loop would
+    let a future be reused, but a shared mock would carry call counts over.
+    """
+    future = asyncio.get_running_loop().create_future()
+    future.set_result(value)
+    return MagicMock(return_value=future)
+
+
+@pytest.fixture(scope='module')
+def mock_landmarks():
+    """Deterministic MediaPipe-sized landmarks, shared read-only across the module"""
+    points = np.random.default_rng(0).random((468, 3), dtype=np.float32)
+    points.setflags(write=False)
+    
+    return FacialLandmarks(
+        points=points,
+        confidence=0.95,
+        face_rect=(100, 100, 200, 200),
+        model_type='mediapipe'
+    )
+
+
 class TestTTSService:
     """Test Text-to-Speech Service"""
     
-    @pytest.fixture
+    @pytest.fixture(scope='class')
     def tts_service(self):
         with patch('services.tts_service.current_app') as mock_app:
             mock_app.config.get.return_value = 'test_api_key'
-            return TTSService()
+            with patch('services.tts_service.Redis') as mock_redis:
+                mock_redis.return_value.get.return_value = None
+                return TTSService()
     
     def test_get_available_voices(self, tts_service):
         """Test voice listing functionality"""
@@ -104,7 +152,41 @@ class TestTTSService:
         assert result['provider'] == 'azure'
         assert result['cost'] > 0
     
-    @patch('requests.post')
+    @patch('services.tts_service.speechsdk')
+    def test_synthesize_with_azure_streaming(self, mock_speechsdk, tts_service):
+        """Test Azure TTS streams audio chunks as they are synthesized"""
+        mock_result = Mock()
+        mock_result.reason = mock_speechsdk.ResultReason.SynthesizingAudioStarted
+        
+        mock_synthesizer = Mock()
+        mock_synthesizer.start_speaking_text_async.return_value.get.return_value = mock_result
+        mock_speechsdk.SpeechSynthesizer.return_value = mock_synthesizer
+        mock_speechsdk.AudioDataStream.return_value.read_data.side_effect = [16000, 8000, 0]
+        
+        result = tts_service.synthesize_speech(
+            "Test text",
+            'en-US-JennyNeural',
+            {'stream': True}
+        )
+        
+        assert result['success'] is True
+        assert result['provider'] == 'azure'
+        assert [len(chunk) for chunk in result['audio_stream']] == [16000, 8000]
+        mock_synthesizer.speak_text_async.assert_not_called()
+    
+    def test_read_azure_audio_stream_reuses_buffer(self, tts_service):
+        """Test Azure stream reads fill one buffer instead of allocating per chunk"""
+        audio_stream = Mock()
+        audio_stream.read_data.side_effect = [16000] * 100 + [0]
+        
+        chunks = list(tts_service._read_azure_audio_stream(audio_stream))
+        
+        assert len(chunks) == 100
+        assert all(isinstance(chunk, bytes) for chunk in chunks)
+        buffers = {id(call.args[0]) for call in audio_stream.read_data.call_args_list}
+        assert len(buffers) == 1
+    
+    @patch('services._http.HTTP_SESSION.post')
     def test_synthesize_with_elevenlabs(self, mock_post, tts_service):
         """Test ElevenLabs TTS synthesis"""
         # Mock API response
@@ -125,6 +207,21 @@ class TestTTSService:
         assert result['provider'] == 'elevenlabs'
         mock_post.assert_called_once()
     
+    def test_synthesis_cache_hit(self, tts_service):
+        """Test cached synthesis results skip the provider entirely"""
+        cached_result = {
+            'success': True,
+            'audio_data': base64.b64encode(b'cached_audio').decode('utf-8'),
+            'provider': 'azure'
+        }
+        
+        with patch.object(tts_service.redis_client, 'get', return_value=json.dumps(cached_result)):
+            with patch.object(tts_service, '_synthesize_with_azure') as mock_azure:
+                result = tts_service.synthesize_speech("Test text", 'en-US-JennyNeural')
+        
+        assert result == cached_result
+        mock_azure.assert_not_called()
+    
     def test_estimate_speech_duration(self, tts_service):
         """Test speech duration estimation"""
         text = "This is a test sentence with ten words in it."
@@ -142,6 +239,9 @@ class TestTTSService:
         assert "Street" in optimized
         assert "Avenue" in optimized
         assert "United States" in optimized
+        
+        # Abbreviations only expand at a word start
+        assert tts_service.optimize_text_for_speech("FirSt. place") == "FirSt. place"
     
     def test_calculate_tts_cost(self, tts_service):
         """Test TTS cost calculation"""
@@ -159,21 +259,12 @@ class TestTTSService:
 class TestLipSyncAnimationEngine:
     """Test Lip-Sync Animation Engine"""
     
-    @pytest.fixture
+    @pytest.fixture(scope='class')
     def lipsync_engine(self):
         with patch('services.lipsync_service.current_app') as mock_app:
             mock_app.config.get.return_value = 'test_path'
             return LipSyncAnimationEngine()
     
-    @pytest.fixture
-    def mock_landmarks(self):
-        return FacialLandmarks(
-            points=np.random.rand(468, 3),
-            confidence=0.95,
-            face_rect=(100, 100, 200, 200),
-            model_type='mediapipe'
-        )
-    
     def test_phoneme_to_viseme_mapping(self):
         """Test phoneme to viseme conversion"""
         assert PhonemeMapper.phoneme_to_viseme('AA') == VisemeType.AA
@@ -188,16 +279,18 @@ class TestLipSyncAnimationEngine:
         # Mock image
         mock_imread.return_value = np.zeros((640, 480, 3), dtype=np.uint8)
         
-        with patch.object(lipsync_engine.mp_face_mesh, 'FaceMesh') as mock_face_mesh:
+        with patch.object(lipsync_engine, '_face_mesh') as mock_face_mesh:
             # Mock MediaPipe results
             mock_results = Mock()
             mock_landmark = Mock()
             mock_landmark.x = 0.5
             mock_landmark.y = 0.5
             mock_landmark.z = 0.0
-            mock_results.multi_face_landmarks = [[mock_landmark] * 468]
+            mock_face = Mock()
+            mock_face.landmark = [mock_landmark] * 468
+            mock_results.multi_face_landmarks = [mock_face]
             
-            mock_face_mesh.return_value.__enter__.return_value.process.return_value = mock_results
+            mock_face_mesh.process.return_value = mock_results
             
             landmarks = lipsync_engine._extract_facial_landmarks('test_image.jpg')
             
@@ -226,16 +319,7 @@ class TestLipSyncAnimationEngine:
         samples = np.random.randint(-32768, 32767, int(sample_rate * duration), dtype=np.int16)
         
         # Create WAV format data
-        import wave
-        import io
-        wav_io = io.BytesIO()
-        with wave.open(wav_io, 'wb') as wav:
-            wav.setnchannels(1)
-            wav.setsampwidth(2)
-            wav.setframerate(sample_rate)
-            wav.writeframes(samples.tobytes())
-        
-        audio_data = wav_io.getvalue()
+        audio_data = _wav_header(len(samples), sample_rate) + samples.tobytes()
         
         visemes = lipsync_engine._audio_amplitude_to_visemes(audio_data, duration)
         
@@ -243,40 +327,38 @@ class TestLipSyncAnimationEngine:
         assert all(isinstance(v, Viseme) for v in visemes)
         assert all(0 <= v.intensity <= 1 for v in visemes)
     
-    def test_generate_facial_expressions(self, lipsync_engine):
+    @pytest.mark.parametrize('emotion', ['neutral', 'happy', 'sad', 'angry', 'excited'])
+    def test_generate_facial_expressions(self, lipsync_engine, emotion):
         """Test facial expression generation"""
         audio_data = b'mock_audio'
         n_frames = 30
         
-        # Test different emotions
-        for emotion in ['neutral', 'happy', 'sad', 'angry', 'excited']:
-            expressions = lipsync_engine._generate_facial_expressions(
-                audio_data, emotion, n_frames
-            )
-            
-            assert len(expressions) == n_frames
-            assert all(isinstance(e, FacialExpression) for e in expressions)
-            
-            # Check emotion-specific attributes
-            if emotion == 'happy':
-                assert any(e.smile > 0 for e in expressions)
-            elif emotion == 'sad':
-                assert any(e.smile < 0 for e in expressions)
+        expressions = lipsync_engine._generate_facial_expressions(
+            audio_data, emotion, n_frames
+        )
+        
+        assert len(expressions) == n_frames
+        assert all(isinstance(e, FacialExpression) for e in expressions)
+        
+        # Check emotion-specific attributes
+        if emotion == 'happy':
+            assert any(e.smile > 0 for e in expressions)
+        elif emotion == 'sad':
+            assert any(e.smile < 0 for e in expressions)
     
-    def test_calculate_mouth_deformation(self, lipsync_engine):
+    @pytest.mark.parametrize('viseme_type', list(VisemeType), ids=lambda v: v.name)
+    def test_calculate_mouth_deformation(self, lipsync_engine, viseme_type):
         """Test mouth deformation calculation"""
-        # Test different visemes
-        for viseme_type in VisemeType:
-            deformation = lipsync_engine._calculate_mouth_deformation(viseme_type, 1.0)
-            
-            assert len(deformation) == 3
-            assert all(isinstance(d, (int, float)) for d in deformation)
-            
-            # Check specific viseme characteristics
-            if viseme_type == VisemeType.AA:
-                assert deformation[2] > 0.5  # Should be open
-            elif viseme_type == VisemeType.MM:
-                assert deformation[2] == 0  # Should be closed
+        deformation = lipsync_engine._calculate_mouth_deformation(viseme_type, 1.0)
+        
+        assert len(deformation) == 3
+        assert all(isinstance(d, (int, float)) for d in deformation)
+        
+        # Check specific viseme characteristics
+        if viseme_type == VisemeType.AA:
+            assert deformation[2] > 0.5  # Should be open
+        elif viseme_type == VisemeType.MM:
+            assert deformation[2] == 0  # Should be closed
     
     @patch('cv2.imread')
     def test_create_animation_frames(self, mock_imread, lipsync_engine, mock_landmarks):
@@ -311,6 +393,19 @@ class TestLipSyncAnimationEngine:
         assert all('viseme' in f for f in frames)
         assert all('data' in f for f in frames)
     
+    def test_assign_visemes_to_frames(self, lipsync_engine, benchmark):
+        """Test batched viseme lookup matches the per-frame scan for a 5 minute video"""
+        visemes = [
+            Viseme(viseme_type, i * 0.1, (i + 1) * 0.1, 0.5, '')
+            for i, viseme_type in enumerate(list(VisemeType) * 200)
+        ]
+        frame_times = np.arange(9000) / 30
+        
+        indices = benchmark(lipsync_engine._assign_visemes_to_frames, visemes, frame_times)
+        
+        expected = [lipsync_engine._get_viseme_at_time(visemes, t) for t in frame_times.tolist()]
+        assert [visemes[i] if i >= 0 else None for i in indices.tolist()] == expected
+    
     def test_calculate_animation_metrics(self, lipsync_engine):
         """Test animation metrics calculation"""
         frames = [
@@ -332,12 +427,26 @@ class TestLipSyncAnimationEngine:
         assert 'viseme_coverage' in metrics
         assert 0 <= metrics['lip_sync_accuracy'] <= 100
         assert 0 <= metrics['animation_smoothness'] <= 100
+    
+    def test_calculate_animation_metrics_long_video(self, lipsync_engine):
+        """Test metrics over a 100 second, 30fps animation"""
+        frames = [{'viseme_intensity': 0.5} for _ in range(3000)]
+        visemes = [
+            Viseme(viseme_type, i * 0.1, (i + 1) * 0.1, 0.8, '')
+            for i, viseme_type in enumerate(VisemeType)
+        ]
+        
+        metrics = lipsync_engine._calculate_animation_metrics(frames, visemes)
+        
+        assert metrics['animation_smoothness'] == pytest.approx(100.0)
+        assert metrics['unique_visemes'] == len(VisemeType)
+        assert metrics['average_viseme_duration'] == pytest.approx(0.1)
 
 
 class TestVideoGenerationPipeline:
     """Test Video Generation Pipeline"""
     
-    @pytest.fixture
+    @pytest.fixture(scope='class')
     def video_pipeline(self):
         with patch('services.video_generation_service.current_app') as mock_app:
             mock_app.config.get.return_value = 'test_value'
@@ -348,7 +457,7 @@ class TestVideoGenerationPipeline:
     def video_request(self):
         return VideoGenerationRequest(
             source_image='test_image.jpg',
-            audio_data=b'test_audio',
+            audio_data=TEST_AUDIO_BYTES,
             script_text='Test script',
             quality=VideoQuality.STANDARD,
             aspect_ratio=AspectRatio.LANDSCAPE,
@@ -361,7 +470,7 @@ class TestVideoGenerationPipeline:
         with patch.object(video_pipeline.tts_service, 'synthesize_speech') as mock_tts:
             mock_tts.return_value = {
                 'success': True,
-                'audio_data': base64.b64encode(b'test_audio').decode('utf-8'),
+                'audio_data': TEST_AUDIO_B64,
                 'duration_seconds': 30,
                 'sample_rate': 16000
             }
@@ -390,7 +499,7 @@ class TestVideoGenerationPipeline:
             'frame_rate': 30
         }
         
-        with patch('requests.post') as mock_post:
+        with patch('services._http.HTTP_SESSION.post') as mock_post:
             # Mock initial job submission
             mock_post.return_value.status_code = 200
             mock_post.return_value.json.return_value = {'job_id': 'test_job_123'}
@@ -420,7 +529,7 @@ class TestVideoGenerationPipeline:
             'frame_rate': 30
         }
         
-        with patch('requests.post') as mock_post:
+        with patch('services._http.HTTP_SESSION.post') as mock_post:
             mock_post.return_value.status_code = 201
             mock_post.return_value.json.return_value = {'id': 'gen_456'}
             
@@ -450,20 +559,36 @@ class TestVideoGenerationPipeline:
             'processing_time': 60
         }
         
-        with patch('subprocess.run') as mock_run:
-            mock_run.return_value.returncode = 0
+        with patch.object(video_pipeline, '_transcode_for_web',
+                          return_value=b'optimized_video') as mock_transcode:
+            result = await video_pipeline._post_process_video(
+                video_result, video_request, 'test_video_id'
+            )
             
-            with patch('tempfile.NamedTemporaryFile'):
-                with patch('builtins.open', create=True) as mock_open:
-                    mock_open.return_value.__enter__.return_value.read.return_value = b'optimized_video'
-                    
-                    result = await video_pipeline._post_process_video(
-                        video_result, video_request, 'test_video_id'
-                    )
-                    
-                    assert result['success'] is True
-                    assert 'optimization' in result
-                    assert result['optimization']['original_size'] > 0
+            mock_transcode.assert_called_once_with(b'raw_video_data', video_request.quality)
+            assert result['success'] is True
+            assert result['video_data'] == b'optimized_video'
+            assert 'optimization' in result
+            assert result['optimization']['original_size'] > 0
+    
+    @pytest.mark.asyncio
+    async def test_post_process_video_transcode_failure(self, video_pipeline, video_request):
+        """Test post-processing falls back to the original video when libav fails"""
+        video_result = {
+            'success': True,
+            'video_data': b'raw_video_data',
+            'provider': 'veo3',
+            'cost': 4.5,
+            'processing_time': 60
+        }
+        
+        with patch('services.video_generation_service.av.open',
+                   side_effect=av.error.InvalidDataError(1094995529, 'Invalid data')):
+            result = await video_pipeline._post_process_video(
+                video_result, video_request, 'test_video_id'
+            )
+            
+            assert result is video_result
     
     @pytest.mark.asyncio
     async def test_get_fallback_provider(self, video_pipeline, video_request):
@@ -508,12 +633,12 @@ class TestVideoGenerationPipeline:
 class TestCostOptimizationService:
     """Test Cost Optimization Service"""
     
-    @pytest.fixture
+    @pytest.fixture(scope='class')
     def cost_service(self):
         with patch('services.cost_optimization_service.current_app') as mock_app:
             mock_app.config.get.return_value = 'test_value'
             with patch('services.cost_optimization_service.Redis') as mock_redis:
-                mock_redis.return_value.hgetall.return_value = {
+                metrics = {
                     'success_rate': '0.95',
                     'average_processing_time': '60',
                     'average_cost': '0.15',
@@ -522,8 +647,18 @@ class TestCostOptimizationService:
                     'availability_score': '0.95',
                     'quality_score': '0.85'
                 }
+                mock_redis.return_value.hgetall.return_value = metrics
+                mock_redis.return_value.pipeline.return_value.execute.return_value = (
+                    [metrics] * len(VideoGenerationProvider)
+                )
                 return CostOptimizationService()
     
+    @pytest.fixture(autouse=True)
+    def reset_metrics_cache(self, cost_service):
+        """Clear provider metrics cached on the shared service by a test"""
+        yield
+        cost_service._metrics_cache.clear()
+    
     def test_select_optimal_provider(self, cost_service):
         """Test optimal provider selection with cost optimization"""
         provider, estimate = cost_service.select_optimal_provider(
@@ -615,6 +750,17 @@ class TestCostOptimizationService:
             assert 'average_processing_time' in call_args
             assert 'quality_score' in call_args
     
+    def test_increment_provider_load_drops_cached_metrics(self, cost_service):
+        """Test a job start makes the next selection re-read provider load"""
+        cost_service._get_provider_metrics(VideoGenerationProvider.VEO3)
+        assert VideoGenerationProvider.VEO3 in cost_service._metrics_cache
+        
+        with patch.object(cost_service.redis_client, 'hincrby') as mock_hincrby:
+            cost_service.increment_provider_load(VideoGenerationProvider.VEO3)
+        
+        mock_hincrby.assert_called_once_with('provider_metrics:veo3', 'current_load', 1)
+        assert VideoGenerationProvider.VEO3 not in cost_service._metrics_cache
+    
     def test_get_cost_breakdown(self, cost_service):
         """Test detailed cost breakdown"""
         breakdown = cost_service.get_cost_breakdown(
@@ -653,7 +799,7 @@ class TestCostOptimizationService:
 class TestWebSocketService:
     """Test WebSocket Service"""
     
-    @pytest.fixture
+    @pytest.fixture(scope='class')
     def websocket_service(self):
         with patch('services.websocket_service.current_app') as mock_app:
             mock_app.config.get.return_value = 'test_value'
@@ -661,6 +807,13 @@ class TestWebSocketService:
                 mock_socketio = Mock()
                 return WebSocketService(mock_socketio)
     
+    @pytest.fixture(autouse=True)
+    def reset_connections(self, websocket_service):
+        """Clear connection tracking left on the shared service by a test"""
+        yield
+        websocket_service.active_connections.clear()
+        websocket_service.session_to_user.clear()
+    
     def test_authenticate_connection(self, websocket_service):
         """Test WebSocket authentication"""
         with patch('services.websocket_service.jwt.decode') as mock_decode:
@@ -690,6 +843,9 @@ class TestWebSocketService:
                 emit_args = mock_emit.call_args[0]
                 assert emit_args[0] == 'video_progress'
                 assert emit_args[1]['video_id'] == 'test_video'
+                
+                stored = json.loads(mock_setex.call_args[0][2])
+                assert stored == emit_args[1]['progress']
     
     def test_notify_video_completed(self, websocket_service):
         """Test video completion notification"""
@@ -733,14 +889,20 @@ class TestWebSocketService:
         with patch.object(websocket_service.redis_client, 'scan_iter') as mock_scan:
             mock_scan.return_value = ['video_progress:1', 'video_progress:2']
             
-            with patch.object(websocket_service.redis_client, 'get') as mock_get:
-                mock_get.return_value = json.dumps({'status': 'processing'})
+            with patch.object(websocket_service.redis_client, 'mget') as mock_mget, \
+                    patch.object(websocket_service.redis_client, 'get') as mock_get:
+                mock_mget.return_value = [
+                    json.dumps({'status': 'processing'}),
+                    json.dumps({'status': 'processing'})
+                ]
                 
                 stats = websocket_service.get_connection_stats()
                 
                 assert stats['connected_users'] == 2
                 assert stats['active_sessions'] == 3
                 assert stats['active_video_generations'] == 2
+                mock_mget.assert_called_once_with(['video_progress:1', 'video_progress:2'])
+                mock_get.assert_not_called()
 
 
 # Integration Tests
@@ -756,34 +918,51 @@ class TestIntegration:
                 
                 request = VideoGenerationRequest(
                     source_image='test_image.jpg',
-                    audio_data=b'test_audio',
+                    audio_data=TEST_AUDIO_BYTES,
                     script_text='Hello, this is a test video.',
                     quality=VideoQuality.STANDARD,
                     aspect_ratio=AspectRatio.LANDSCAPE,
                     duration=10.0
                 )
                 
+                # Track how many of the independent stages are in flight at once
+                in_flight = {'current': 0, 'peak': 0}
+                
+                def concurrent_stage(result):
+                    async def stage(*args, **kwargs):
+                        in_flight['current'] += 1
+                        in_flight['peak'] = max(in_flight['peak'], in_flight['current'])
+                        await asyncio.sleep(0)
+                        in_flight['current'] -= 1
+                        return result
+                    return MagicMock(side_effect=stage)
+                
                 # Mock all external services
                 with patch.multiple(pipeline,
-                    _generate_audio=AsyncMock(return_value={'success': True, 'audio_data': b'audio', 'duration': 10}),
-                    _analyze_facial_landmarks=AsyncMock(return_value={'success': True, 'landmarks': Mock()}),
-                    _generate_lipsync_animation=AsyncMock(return_value={'success': True, 'frames': []}),
-                    _select_optimal_provider=AsyncMock(return_value=VideoGenerationProvider.VEO3),
-                    _generate_with_provider=AsyncMock(return_value={'success': True, 'video_data': b'video'}),
-                    _post_process_video=AsyncMock(return_value={'success': True, 'video_data': b'final_video'}),
-                    _update_progress=AsyncMock()
+                    _generate_audio=concurrent_stage({'success': True, 'audio_data': b'audio', 'duration': 10}),
+                    _analyze_facial_landmarks=concurrent_stage({'success': True, 'landmarks': Mock()}),
+                    _generate_lipsync_animation=_resolved({'success': True, 'frames': []}),
+                    _select_optimal_provider=_resolved(VideoGenerationProvider.VEO3),
+                    _generate_with_provider=_resolved({'success': True, 'video_data': b'video'}),
+                    _post_process_video=_resolved({'success': True, 'video_data': b'final_video'}),
+                    _update_progress=_resolved()
                 ):
                     result = await pipeline.generate_video_async(request, 'test_video_id')
                     
                     assert result['success'] is True
                     assert result['video_data'] == b'final_video'
+                    assert in_flight['peak'] == 2
+                    progress = [c.args[1] for c in pipeline._update_progress.call_args_list]
+                    assert progress == [0, 20, 100]
     
     def test_cost_optimization_with_real_metrics(self):
         """Test cost optimization with realistic metrics"""
         with patch('services.cost_optimization_service.current_app'):
             with patch('services.cost_optimization_service.Redis') as mock_redis:
-                # Setup realistic metrics
-                mock_redis.return_value.hgetall.side_effect = [
+                # Setup realistic metrics, in provider order for every provider
+                # that supports a 30 second standard landscape video
+                mock_pipeline = mock_redis.return_value.pipeline.return_value
+                mock_pipeline.execute.return_value = [
                     # VEO3 metrics - good all-around
                     {
                         'success_rate': '0.95',
@@ -794,7 +973,7 @@ class TestIntegration:
                         'availability_score': '0.95',
                         'quality_score': '0.85'
                     },
-                    # Runway metrics - high quality but expensive
+                    # Synthesia metrics - high quality but expensive
                     {
                         'success_rate': '0.98',
                         'average_processing_time': '90',
@@ -803,6 +982,26 @@ class TestIntegration:
                         'error_count': '0',
                         'availability_score': '0.98',
                         'quality_score': '0.92'
+                    },
+                    # D-ID metrics - currently pricier and lower quality
+                    {
+                        'success_rate': '0.95',
+                        'average_processing_time': '60',
+                        'average_cost': '0.18',
+                        'current_load': '5',
+                        'error_count': '0',
+                        'availability_score': '0.95',
+                        'quality_score': '0.80'
+                    },
+                    # HeyGen metrics - currently pricier and lower quality
+                    {
+                        'success_rate': '0.95',
+                        'average_processing_time': '60',
+                        'average_cost': '0.18',
+                        'current_load': '5',
+                        'error_count': '0',
+                        'availability_score': '0.95',
+                        'quality_score': '0.80'
                     }
                 ]
                 
@@ -818,4 +1017,16 @@ class TestIntegration:
                 
                 # Should prefer VEO3 for cost optimization
                 assert provider == VideoGenerationProvider.VEO3
-                assert estimate.estimated_cost < 10  # Reasonable cost for 30 seconds
\ No newline at end of file
+                assert estimate.estimated_cost < 10  # Reasonable cost for 30 seconds
+                
+                # A repeated selection is served from the in-process metrics cache
+                service.select_optimal_provider(
+                    duration=30,
+                    quality=VideoQuality.STANDARD,
+                    aspect_ratio=AspectRatio.LANDSCAPE,
+                    user_preferences={'cost_priority': 0.8, 'quality_priority': 0.2}
+                )
+                
+                # All provider metrics are read in one pipelined round trip
+                mock_pipeline.execute.assert_called_once()
+                mock_redis.return_value.hgetall.assert_not_called()
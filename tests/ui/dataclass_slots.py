@@ -0,0 +1,36 @@
+"""
+TalkingPhoto AI MVP - Slotted Dataclass Helper
+
+Shared by the UI testing frameworks for result and configuration types that
+are created in large numbers.
+"""
+
+from dataclasses import fields
+
+
+def with_slots(cls):
+    """Rebuild a dataclass with __slots__, as dataclass(slots=True) does on Python 3.10+
+    
+    Dropping the per-instance __dict__ keeps large result sets compact.
+    Slotted classes cannot use cached_property. Frozen classes also get
+    pickle state hooks, since the default slot restore goes through the
+    blocked __setattr__.
+    """
+    namespace = dict(cls.__dict__)
+    field_names = tuple(f.name for f in fields(cls))
+    for name in field_names + ('__dict__', '__weakref__'):
+        namespace.pop(name, None)
+    namespace['__slots__'] = field_names
+    
+    if cls.__dataclass_params__.frozen:
+        def __getstate__(self):
+            return tuple(getattr(self, name) for name in field_names)
+        
+        def __setstate__(self, state):
+            for name, value in zip(field_names, state):
+                object.__setattr__(self, name, value)
+        
+        namespace['__getstate__'] = __getstate__
+        namespace['__setstate__'] = __setstate__
+    
+    return type(cls)(cls.__name__, cls.__bases__, namespace)
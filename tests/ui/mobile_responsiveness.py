@@ -12,11 +12,15 @@ mobile performance characteristics.
 
 import pytest
 from typing import Dict, List, Tuple, Any, Optional
-from dataclasses import dataclass
-from enum import Enum
+from dataclasses import dataclass, field
+from enum import Enum, IntEnum
 from unittest.mock import Mock, patch, MagicMock
+from concurrent.futures import ProcessPoolExecutor
+import os
 import time
 
+from dataclass_slots import with_slots
+
 
 class DeviceType(Enum):
     """Mobile device types for testing"""
@@ -31,7 +35,21 @@ class Orientation(Enum):
     LANDSCAPE = "landscape"
 
 
-@dataclass
+class ResponsivenessCategory(IntEnum):
+    """Kind of responsiveness check a result comes from"""
+    GENERIC = 0
+    UPLOAD = 1
+    TOUCH_TARGET = 2
+    GESTURE = 3
+    LAYOUT = 4
+    SCALING = 5
+    NAVIGATION = 6
+    LOAD_PERFORMANCE = 7
+    MEMORY = 8
+
+
+@with_slots
+@dataclass(frozen=True)
 class ViewportConfig:
     """Viewport configuration for responsive testing"""
     name: str
@@ -41,9 +59,15 @@ class ViewportConfig:
     pixel_ratio: float = 1.0
     touch_enabled: bool = True
     user_agent: str = ""
+    is_iphone: bool = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Touch target minimums follow Apple guidelines on iPhones
+        object.__setattr__(self, 'is_iphone', 'iPhone' in self.name)
 
 
-@dataclass
+@with_slots
+@dataclass(frozen=True)
 class ResponsivenessTestResult:
     """Result of a responsiveness test"""
     test_name: str
@@ -54,6 +78,7 @@ class ResponsivenessTestResult:
     issues: List[str]
     recommendations: List[str]
     performance_metrics: Dict[str, Any]
+    category: ResponsivenessCategory = ResponsivenessCategory.GENERIC
 
 
 class ViewportManager:
@@ -135,22 +160,24 @@ class ViewportManager:
         )
     }
     
+    # Viewports of each device type, in VIEWPORTS order
+    _MOBILE_VIEWPORTS = tuple(v for v in VIEWPORTS.values() if v.device_type == DeviceType.PHONE)
+    _TABLET_VIEWPORTS = tuple(v for v in VIEWPORTS.values() if v.device_type == DeviceType.TABLET)
+    
     @staticmethod
     def get_viewport(name: str) -> ViewportConfig:
         """Get viewport configuration by name"""
         return ViewportManager.VIEWPORTS.get(name)
     
     @staticmethod
-    def get_mobile_viewports() -> List[ViewportConfig]:
+    def get_mobile_viewports() -> Tuple[ViewportConfig, ...]:
         """Get all mobile phone viewports"""
-        return [v for v in ViewportManager.VIEWPORTS.values() 
-                if v.device_type == DeviceType.PHONE]
+        return ViewportManager._MOBILE_VIEWPORTS
     
     @staticmethod
-    def get_tablet_viewports() -> List[ViewportConfig]:
+    def get_tablet_viewports() -> Tuple[ViewportConfig, ...]:
         """Get all tablet viewports"""
-        return [v for v in ViewportManager.VIEWPORTS.values() 
-                if v.device_type == DeviceType.TABLET]
+        return ViewportManager._TABLET_VIEWPORTS
 
 
 class MobileUploadTester:
@@ -186,7 +213,8 @@ class MobileUploadTester:
             description="File upload interface mobile compatibility",
             issues=issues,
             recommendations=recommendations,
-            performance_metrics={}
+            performance_metrics={},
+            category=ResponsivenessCategory.UPLOAD
         )
     
     def _test_mobile_file_restrictions(self) -> List[str]:
@@ -210,7 +238,8 @@ class MobileUploadTester:
             description="Upload progress is visible and informative on mobile",
             issues=[],
             recommendations=["Consider haptic feedback for mobile upload completion"],
-            performance_metrics={}
+            performance_metrics={},
+            category=ResponsivenessCategory.UPLOAD
         )
 
 
@@ -228,7 +257,7 @@ class TouchInteractionTester:
         if self.viewport.touch_enabled:
             # Apple Human Interface Guidelines: 44pt minimum
             # Android Material Design: 48dp minimum
-            min_touch_target = 44 if 'iPhone' in self.viewport.name else 48
+            min_touch_target = 44 if self.viewport.is_iphone else 48
             
             # Test primary action buttons
             button_tests = [
@@ -255,7 +284,8 @@ class TouchInteractionTester:
             description="Touch targets meet accessibility guidelines",
             issues=issues,
             recommendations=recommendations,
-            performance_metrics={}
+            performance_metrics={},
+            category=ResponsivenessCategory.TOUCH_TARGET
         )
     
     def test_touch_gestures(self) -> ResponsivenessTestResult:
@@ -277,7 +307,8 @@ class TouchInteractionTester:
             description="Touch gestures work correctly without conflicts",
             issues=issues,
             recommendations=recommendations,
-            performance_metrics={}
+            performance_metrics={},
+            category=ResponsivenessCategory.GESTURE
         )
 
 
@@ -315,7 +346,8 @@ class LayoutResponsivenessTester:
             description="Layout adapts properly to viewport width",
             issues=issues,
             recommendations=recommendations,
-            performance_metrics={}
+            performance_metrics={},
+            category=ResponsivenessCategory.LAYOUT
         )
     
     def test_content_scaling(self) -> ResponsivenessTestResult:
@@ -340,7 +372,8 @@ class LayoutResponsivenessTester:
             description="Content scales appropriately for viewport",
             issues=issues,
             recommendations=recommendations,
-            performance_metrics={}
+            performance_metrics={},
+            category=ResponsivenessCategory.SCALING
         )
     
     def test_navigation_adaptation(self) -> ResponsivenessTestResult:
@@ -361,7 +394,8 @@ class LayoutResponsivenessTester:
             description="Navigation works well on mobile devices",
             issues=issues,
             recommendations=recommendations,
-            performance_metrics={}
+            performance_metrics={},
+            category=ResponsivenessCategory.NAVIGATION
         )
 
 
@@ -403,7 +437,8 @@ class MobilePerformanceTester:
             description="Page loads within acceptable time on mobile",
             issues=issues,
             recommendations=recommendations,
-            performance_metrics=performance_metrics
+            performance_metrics=performance_metrics,
+            category=ResponsivenessCategory.LOAD_PERFORMANCE
         )
     
     def test_memory_usage(self) -> ResponsivenessTestResult:
@@ -437,54 +472,82 @@ class MobilePerformanceTester:
             description="Memory usage is acceptable for mobile devices",
             issues=issues,
             recommendations=recommendations,
-            performance_metrics=memory_metrics
+            performance_metrics=memory_metrics,
+            category=ResponsivenessCategory.MEMORY
         )
 
 
+def _audit_viewport(viewport: ViewportConfig) -> List[ResponsivenessTestResult]:
+    """Run every responsiveness tester against one viewport
+    
+    Module level so worker processes can run it.
+    """
+    results = []
+    
+    # Test file upload behavior
+    upload_tester = MobileUploadTester(viewport)
+    results.append(upload_tester.test_file_upload_interface())
+    results.append(upload_tester.test_upload_feedback())
+    
+    # Test touch interactions
+    touch_tester = TouchInteractionTester(viewport)
+    results.append(touch_tester.test_button_touch_targets())
+    results.append(touch_tester.test_touch_gestures())
+    
+    # Test layout responsiveness
+    layout_tester = LayoutResponsivenessTester(viewport)
+    results.append(layout_tester.test_column_layout())
+    results.append(layout_tester.test_content_scaling())
+    results.append(layout_tester.test_navigation_adaptation())
+    
+    # Test mobile performance
+    performance_tester = MobilePerformanceTester(viewport)
+    results.append(performance_tester.test_loading_performance())
+    results.append(performance_tester.test_memory_usage())
+    
+    return results
+
+
 class MobileResponsivenessAuditor:
     """Main mobile responsiveness auditing class"""
     
-    def __init__(self):
+    def __init__(self, use_parallel: bool = False):
         self.results: List[ResponsivenessTestResult] = []
         self.viewports = ViewportManager.VIEWPORTS
+        self.use_parallel = use_parallel
+        self._cache: Dict[str, List[ResponsivenessTestResult]] = {}
+    
+    def invalidate(self):
+        """Drop cached viewport audits so the next audit runs the testers again"""
+        self._cache.clear()
     
     def audit_viewport(self, viewport_name: str) -> List[ResponsivenessTestResult]:
-        """Audit responsiveness for a specific viewport"""
-        viewport = self.viewports[viewport_name]
-        results = []
+        """Audit responsiveness for a specific viewport
         
-        # Test file upload behavior
-        upload_tester = MobileUploadTester(viewport)
-        results.append(upload_tester.test_file_upload_interface())
-        results.append(upload_tester.test_upload_feedback())
+        Audits are cached per viewport name and each call gets its own copy
+        of the list; call invalidate() after changing viewport configurations.
+        """
+        results = self._cache.get(viewport_name)
+        if results is None:
+            results = self._cache[viewport_name] = _audit_viewport(self.viewports[viewport_name])
         
-        # Test touch interactions
-        touch_tester = TouchInteractionTester(viewport)
-        results.append(touch_tester.test_button_touch_targets())
-        results.append(touch_tester.test_touch_gestures())
-        
-        # Test layout responsiveness
-        layout_tester = LayoutResponsivenessTester(viewport)
-        results.append(layout_tester.test_column_layout())
-        results.append(layout_tester.test_content_scaling())
-        results.append(layout_tester.test_navigation_adaptation())
-        
-        # Test mobile performance
-        performance_tester = MobilePerformanceTester(viewport)
-        results.append(performance_tester.test_loading_performance())
-        results.append(performance_tester.test_memory_usage())
-        
-        return results
+        return list(results)
     
     def audit_all_mobile_viewports(self) -> Dict[str, List[ResponsivenessTestResult]]:
         """Audit responsiveness across all mobile viewports"""
-        mobile_results = {}
-        
         mobile_viewports = ['iphone_12', 'iphone_12_landscape', 'samsung_galaxy_s21', 
                            'mobile_small', 'ipad', 'ipad_landscape', 'android_tablet']
         
-        for viewport_name in mobile_viewports:
-            mobile_results[viewport_name] = self.audit_viewport(viewport_name)
+        # Viewport audits are independent, but each takes microseconds, so
+        # worker processes are opt-in; either way results are cached here in
+        # the parent process
+        pending = [name for name in mobile_viewports if name not in self._cache]
+        if self.use_parallel and len(pending) > 1:
+            with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+                audits = executor.map(_audit_viewport, [self.viewports[name] for name in pending])
+                self._cache.update(zip(pending, audits))
+        
+        mobile_results = {name: self.audit_viewport(name) for name in mobile_viewports}
         
         # Flatten results
         all_results = []
@@ -525,17 +588,53 @@ class MobileResponsivenessAuditor:
             self.audit_all_mobile_viewports()
         
         total_tests = len(self.results)
-        passed_tests = len([r for r in self.results if r.passed])
-        failed_tests = total_tests - passed_tests
-        
-        # Group by device type
-        phone_results = [r for r in self.results if r.viewport.device_type == DeviceType.PHONE]
-        tablet_results = [r for r in self.results if r.viewport.device_type == DeviceType.TABLET]
+        passed_tests = 0
+        
+        # Per device type counts, and load time totals over results with metrics
+        device_tests = {DeviceType.PHONE: 0, DeviceType.TABLET: 0}
+        device_passed = dict.fromkeys(device_tests, 0)
+        device_perf = dict.fromkeys(device_tests, 0)
+        device_load_time = dict.fromkeys(device_tests, 0.0)
+        has_perf = False
+        
+        tested_viewports: Dict[str, ViewportConfig] = {}
+        unique_recommendations: Dict[str, None] = {}
+        by_category: Dict[str, List[ResponsivenessTestResult]] = {}
+        category_passed: Dict[str, int] = {}
+        
+        # Gather every summary in a single pass over the results
+        for r in self.results:
+            viewport = r.viewport
+            device_type = viewport.device_type
+            tested_viewports.setdefault(viewport.name, viewport)
+            unique_recommendations.update(dict.fromkeys(r.recommendations))
+            
+            category = r.component
+            if category not in by_category:
+                by_category[category] = []
+                category_passed[category] = 0
+            by_category[category].append(r)
+            
+            if r.passed:
+                passed_tests += 1
+                category_passed[category] += 1
+            
+            if device_type in device_tests:
+                device_tests[device_type] += 1
+                device_passed[device_type] += r.passed
+            
+            if r.performance_metrics:
+                has_perf = True
+                if device_type in device_perf:
+                    device_perf[device_type] += 1
+                    device_load_time[device_type] += r.performance_metrics.get('initial_load_time', 0)
         
-        phone_passed = len([r for r in phone_results if r.passed])
-        tablet_passed = len([r for r in tablet_results if r.passed])
+        failed_tests = total_tests - passed_tests
+        phone_tests, phone_passed = device_tests[DeviceType.PHONE], device_passed[DeviceType.PHONE]
+        tablet_tests, tablet_passed = device_tests[DeviceType.TABLET], device_passed[DeviceType.TABLET]
         
-        report = f"""
+        # Collect report sections and join them once at the end
+        parts = [f"""
 # TalkingPhoto AI - Mobile Responsiveness Audit Report
 
 ## Executive Summary
@@ -544,77 +643,56 @@ class MobileResponsivenessAuditor:
 - **Failed**: {failed_tests} ({failed_tests/total_tests*100:.1f}%)
 
 ## Device Type Breakdown
-- **Phone Tests**: {len(phone_results)} ({phone_passed} passed, {len(phone_results)-phone_passed} failed)
-- **Tablet Tests**: {len(tablet_results)} ({tablet_passed} passed, {len(tablet_results)-tablet_passed} failed)
+- **Phone Tests**: {phone_tests} ({phone_passed} passed, {phone_tests-phone_passed} failed)
+- **Tablet Tests**: {tablet_tests} ({tablet_passed} passed, {tablet_tests-tablet_passed} failed)
 
 ## Tested Viewports
-"""
+"""]
         
         # List tested viewports
-        tested_viewports = set(r.viewport.name for r in self.results)
-        for viewport_name in tested_viewports:
-            viewport = next(r.viewport for r in self.results if r.viewport.name == viewport_name)
-            report += f"- **{viewport.name}**: {viewport.width}x{viewport.height} ({viewport.device_type.value})\n"
-        
-        report += "\n## Test Results by Category\n\n"
+        parts.extend(
+            f"- **{viewport.name}**: {viewport.width}x{viewport.height} ({viewport.device_type.value})\n"
+            for viewport in tested_viewports.values()
+        )
         
-        # Group by test category
-        by_category = {}
-        for result in self.results:
-            category = result.component
-            if category not in by_category:
-                by_category[category] = []
-            by_category[category].append(result)
+        parts.append("\n## Test Results by Category\n\n")
         
         for category, results in by_category.items():
-            passed_in_category = len([r for r in results if r.passed])
-            total_in_category = len(results)
-            
-            report += f"### {category}\n"
-            report += f"**Status**: {passed_in_category}/{total_in_category} passed\n\n"
+            parts.append(f"### {category}\n")
+            parts.append(f"**Status**: {category_passed[category]}/{len(results)} passed\n\n")
             
             # Show failed tests
-            failed_in_category = [r for r in results if not r.passed]
-            if failed_in_category:
-                report += "**Issues Found**:\n"
-                for result in failed_in_category:
-                    report += f"- {result.test_name} ({result.viewport.name}): {'; '.join(result.issues)}\n"
-                report += "\n"
+            if category_passed[category] < len(results):
+                parts.append("**Issues Found**:\n")
+                parts.extend(
+                    f"- {result.test_name} ({result.viewport.name}): {'; '.join(result.issues)}\n"
+                    for result in results if not result.passed
+                )
+                parts.append("\n")
         
         # Performance metrics summary
-        perf_results = [r for r in self.results if r.performance_metrics]
-        if perf_results:
-            report += "## Performance Metrics Summary\n\n"
+        if has_perf:
+            parts.append("## Performance Metrics Summary\n\n")
             
             # Average load times by device type
-            phone_perf = [r for r in perf_results if r.viewport.device_type == DeviceType.PHONE]
-            tablet_perf = [r for r in perf_results if r.viewport.device_type == DeviceType.TABLET]
-            
-            if phone_perf:
-                avg_load_phone = sum(r.performance_metrics.get('initial_load_time', 0) for r in phone_perf) / len(phone_perf)
-                report += f"- **Average Phone Load Time**: {avg_load_phone:.2f}s\n"
+            if device_perf[DeviceType.PHONE]:
+                avg_load_phone = device_load_time[DeviceType.PHONE] / device_perf[DeviceType.PHONE]
+                parts.append(f"- **Average Phone Load Time**: {avg_load_phone:.2f}s\n")
             
-            if tablet_perf:
-                avg_load_tablet = sum(r.performance_metrics.get('initial_load_time', 0) for r in tablet_perf) / len(tablet_perf)
-                report += f"- **Average Tablet Load Time**: {avg_load_tablet:.2f}s\n"
+            if device_perf[DeviceType.TABLET]:
+                avg_load_tablet = device_load_time[DeviceType.TABLET] / device_perf[DeviceType.TABLET]
+                parts.append(f"- **Average Tablet Load Time**: {avg_load_tablet:.2f}s\n")
             
-            report += "\n"
-        
-        # Recommendations
-        all_recommendations = []
-        for result in self.results:
-            all_recommendations.extend(result.recommendations)
-        
-        # Get unique recommendations
-        unique_recommendations = list(set(all_recommendations))
+            parts.append("\n")
         
+        # Recommendations, deduplicated in first-seen order
         if unique_recommendations:
-            report += "## Priority Recommendations\n\n"
-            for i, rec in enumerate(unique_recommendations[:10], 1):
-                report += f"{i}. {rec}\n"
-            report += "\n"
+            parts.append("## Priority Recommendations\n\n")
+            for i, rec in enumerate(list(unique_recommendations)[:10], 1):
+                parts.append(f"{i}. {rec}\n")
+            parts.append("\n")
         
-        report += """
+        parts.append("""
 ## Mobile Testing Checklist
 
 ### File Upload
@@ -666,9 +744,9 @@ This audit covers:
 
 ---
 *Generated on {time.strftime('%Y-%m-%d %H:%M:%S')}*
-"""
+""")
         
-        return report
+        return ''.join(parts)
 
 
 class MobileTestSuite:
@@ -683,7 +761,7 @@ class MobileTestSuite:
         
         for viewport_name in mobile_viewports:
             results = self.auditor.audit_viewport(viewport_name)
-            upload_results = [r for r in results if 'Upload' in r.test_name]
+            upload_results = [r for r in results if r.category is ResponsivenessCategory.UPLOAD]
             
             failed_uploads = [r for r in upload_results if not r.passed]
             assert len(failed_uploads) == 0, f"Upload failed on {viewport_name}: {[r.issues for r in failed_uploads]}"
@@ -695,7 +773,7 @@ class MobileTestSuite:
         
         for viewport_name in touch_enabled_viewports:
             results = self.auditor.audit_viewport(viewport_name)
-            touch_results = [r for r in results if 'Touch Target' in r.test_name]
+            touch_results = [r for r in results if r.category is ResponsivenessCategory.TOUCH_TARGET]
             
             failed_touch = [r for r in touch_results if not r.passed]
             assert len(failed_touch) == 0, f"Touch targets too small on {viewport_name}"
@@ -706,7 +784,7 @@ class MobileTestSuite:
         
         for viewport_name in test_viewports:
             results = self.auditor.audit_viewport(viewport_name)
-            layout_results = [r for r in results if 'Layout' in r.test_name or 'Scaling' in r.test_name]
+            layout_results = [r for r in results if r.category in (ResponsivenessCategory.LAYOUT, ResponsivenessCategory.SCALING)]
             
             critical_layout_failures = [r for r in layout_results 
                                       if not r.passed and 'horizontal scrolling' in ' '.join(r.issues)]
@@ -0,0 +1,65 @@
+"""
+TalkingPhoto AI MVP - Accessibility Audit Tests
+
+Regression tests for the accessibility audit framework itself, covering
+report generation end to end.
+"""
+
+import copy
+import pickle
+import re
+
+import pytest
+
+from accessibility_audit import AccessibilityAuditor
+
+
+class TestAccessibilityReport:
+    """Test accessibility audit report generation"""
+
+    def test_generate_report_runs_full_audit(self, accessibility_auditor):
+        """Test report is generated from a fresh auditor"""
+        report = accessibility_auditor.generate_report()
+
+        assert report.startswith("\n# TalkingPhoto AI - Accessibility Audit Report")
+        assert f"**Total Tests**: {len(accessibility_auditor.results)}" in report
+        assert "## WCAG 2.1 Compliance Status" in report
+
+    def test_generate_report_timestamp(self, accessibility_auditor):
+        """Test report footer carries a rendered timestamp"""
+        report = accessibility_auditor.generate_report()
+
+        assert "{import" not in report
+        assert re.search(r"\*Generated on \d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}\*\n$", report)
+
+
+class TestFullAudit:
+    """Test full audit caching"""
+
+    def test_cached_audit_is_not_shared(self, accessibility_auditor):
+        """Test a caller changing its results leaves the cache intact"""
+        audit = accessibility_auditor.run_full_audit()
+        expected = {category: len(results) for category, results in audit.items()}
+        audit['color_contrast'].clear()
+        del audit['keyboard_navigation']
+
+        again = accessibility_auditor.run_full_audit()
+        assert {category: len(results) for category, results in again.items()} == expected
+
+
+
+class TestAccessibilityResult:
+    """Test the slotted result type"""
+
+    def test_result_survives_pickle_and_deepcopy(self, accessibility_auditor):
+        """Test frozen slotted results can still be copied and pickled"""
+        result = accessibility_auditor.run_full_audit()['color_contrast'][0]
+
+        assert pickle.loads(pickle.dumps(result)) == result
+        assert copy.deepcopy(result) == result
+
+
+@pytest.fixture
+def accessibility_auditor():
+    """Provide accessibility auditor instance"""
+    return AccessibilityAuditor()
@@ -0,0 +1,81 @@
+"""
+TalkingPhoto AI MVP - Cross-Browser Compatibility Matrix Tests
+
+Runs every browser/feature pair of the compatibility matrix as its own
+parametrized test, so pytest-xdist can spread the matrix across worker
+processes:
+
+    pytest -n auto --dist load tests/ui/test_cross_browser_compatibility.py
+"""
+
+import re
+
+import pytest
+
+from cross_browser_compatibility import BrowserManager, CrossBrowserTestSuite, StreamlitFeatureTester
+
+BROWSER_MANAGER = BrowserManager()
+FEATURE_TESTER = StreamlitFeatureTester()
+
+
+class TestBrowserCompatibilityMatrix:
+    """Test each feature in each supported browser configuration"""
+
+    @pytest.mark.parametrize("test", FEATURE_TESTER.compatibility_tests, ids=lambda t: t.name)
+    @pytest.mark.parametrize("browser", BROWSER_MANAGER.supported_browsers, ids=lambda b: b.identifier)
+    def test_browser_compatibility(self, browser, test):
+        """Test feature has no critical failure in the browser"""
+        result = FEATURE_TESTER.test_browser_compatibility(browser, test)
+
+        assert result.browser_config is browser
+        assert result.test_name == test.name
+        assert result.severity != "critical", f"{test.name} fails in {browser.identifier}: {result.issues_found}"
+
+    def test_performance_metrics_are_not_shared(self):
+        """Test changing one result's metrics leaves other results intact"""
+        browser = BROWSER_MANAGER.supported_browsers[0]
+        test = FEATURE_TESTER.compatibility_tests[0]
+        first = FEATURE_TESTER.test_browser_compatibility(browser, test)
+        first.performance_metrics["load_time"] = -1.0
+
+        second = FEATURE_TESTER.test_browser_compatibility(browser, test)
+        assert second.performance_metrics["load_time"] > 0
+
+
+class TestCompatibilityRunCache:
+    """Test compatibility runs and analysis are reused until cleared"""
+
+    def test_repeat_run_reuses_results(self):
+        """Test a repeated subset run and analysis do no new work"""
+        suite = CrossBrowserTestSuite(use_parallel=False)
+        matrix = suite.run_compatibility_tests("priority")
+        analysis = suite.analyze_compatibility_gaps()
+
+        assert suite.run_compatibility_tests("priority") is matrix
+        assert suite.analyze_compatibility_gaps() == analysis
+
+        suite.clear_cache()
+
+        assert not suite.compatibility_matrix.results
+
+    def test_analysis_is_not_shared(self):
+        """Test a caller changing its analysis leaves later analyses intact"""
+        suite = CrossBrowserTestSuite()
+        analysis = suite.analyze_compatibility_gaps()
+        expected_issues = dict(analysis['browser_specific_issues'])
+        analysis['browser_specific_issues'].clear()
+
+        assert suite.analyze_compatibility_gaps()['browser_specific_issues'] == expected_issues
+
+
+class TestCompatibilityReport:
+    """Test compatibility report rendering"""
+
+    def test_report_footer_is_rendered(self):
+        """Test report footer carries a timestamp and browser count"""
+        suite = CrossBrowserTestSuite(use_parallel=False)
+        report = suite.generate_compatibility_report()
+
+        assert "{" not in report
+        assert re.search(r"\*Generated on \d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}\*\n", report)
+        assert f"*Tested across {len(BROWSER_MANAGER.get_priority_browsers())} browser configurations*\n" in report
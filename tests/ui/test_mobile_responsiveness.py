@@ -0,0 +1,54 @@
+"""
+TalkingPhoto AI MVP - Mobile Responsiveness Audit Tests
+
+Regression tests for the mobile responsiveness audit framework itself,
+covering viewport audit caching and report generation.
+"""
+
+import pytest
+
+from mobile_responsiveness import MobileResponsivenessAuditor, ResponsivenessCategory
+
+
+class TestViewportAuditCache:
+    """Test viewport audits are reused until invalidated"""
+
+    def test_repeat_audit_is_cached(self, mobile_auditor):
+        """Test auditing the same viewport twice reuses the results"""
+        results = mobile_auditor.audit_viewport('iphone_12')
+        repeat = mobile_auditor.audit_viewport('iphone_12')
+
+        assert repeat is not results
+        assert all(a is b for a, b in zip(repeat, results))
+
+    def test_cached_audit_is_not_shared(self, mobile_auditor):
+        """Test a caller changing its results leaves the cache intact"""
+        results = mobile_auditor.audit_viewport('iphone_12')
+        results.clear()
+
+        assert len(mobile_auditor.audit_viewport('iphone_12')) == 9
+
+    def test_invalidate_reruns_audit(self, mobile_auditor):
+        """Test invalidating the cache runs the testers again"""
+        results = mobile_auditor.audit_viewport('iphone_12')
+        mobile_auditor.invalidate()
+
+        assert mobile_auditor.audit_viewport('iphone_12')[0] is not results[0]
+
+
+class TestResultCategories:
+    """Test results are tagged with the check that produced them"""
+
+    def test_upload_results_are_categorized(self, mobile_auditor):
+        """Test both upload checks carry the upload category"""
+        results = mobile_auditor.audit_viewport('iphone_12')
+        upload_results = [r for r in results if r.category is ResponsivenessCategory.UPLOAD]
+
+        assert [r.test_name for r in upload_results] == ["Mobile File Upload", "Upload Progress Feedback"]
+        assert all(r.category is not ResponsivenessCategory.GENERIC for r in results)
+
+
+@pytest.fixture
+def mobile_auditor():
+    """Provide mobile responsiveness auditor"""
+    return MobileResponsivenessAuditor()
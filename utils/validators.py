@@ -10,6 +10,22 @@ from flask import current_app
 from typing import List, Optional
 
 
+# Patterns compiled once at import instead of on every validation call
+EMAIL_PATTERN = re.compile(
+    r'^[a-zA-Z0-9.!#$%&\'*+/=?^_`{|}~-]+@[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}'
+    r'[a-zA-Z0-9])?(?:\.[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?)*$'
+)
+PASSWORD_LOWERCASE_PATTERN = re.compile(r'[a-z]')
+PASSWORD_UPPERCASE_PATTERN = re.compile(r'[A-Z]')
+PASSWORD_DIGIT_PATTERN = re.compile(r'\d')
+PASSWORD_SPECIAL_PATTERN = re.compile(r'[!@#$%^&*(),.?":{}|<>]')
+
+WEAK_PASSWORDS = frozenset({
+    'password', '12345678', 'qwerty123', 'admin123', 'welcome123',
+    'password123', 'letmein123', 'monkey123', 'dragon123'
+})
+
+
 def validate_email(email: str) -> bool:
     """
     Validate email format using RFC 5322 compliant regex
@@ -17,12 +33,7 @@ def validate_email(email: str) -> bool:
     if not email or len(email) > 254:
         return False
     
-    pattern = re.compile(
-        r'^[a-zA-Z0-9.!#$%&\'*+/=?^_`{|}~-]+@[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}'
-        r'[a-zA-Z0-9])?(?:\.[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?)*$'
-    )
-    
-    return bool(pattern.match(email))
+    return bool(EMAIL_PATTERN.match(email))
 
 
 def validate_password(password: str) -> str:
@@ -39,28 +50,23 @@ def validate_password(password: str) -> str:
         raise ValidationError("Password must be less than 128 characters")
     
     # Check for at least one lowercase letter
-    if not re.search(r'[a-z]', password):
+    if not PASSWORD_LOWERCASE_PATTERN.search(password):
         raise ValidationError("Password must contain at least one lowercase letter")
     
     # Check for at least one uppercase letter
-    if not re.search(r'[A-Z]', password):
+    if not PASSWORD_UPPERCASE_PATTERN.search(password):
         raise ValidationError("Password must contain at least one uppercase letter")
     
     # Check for at least one digit
-    if not re.search(r'\d', password):
+    if not PASSWORD_DIGIT_PATTERN.search(password):
         raise ValidationError("Password must contain at least one number")
     
     # Check for at least one special character
-    if not re.search(r'[!@#$%^&*(),.?":{}|<>]', password):
+    if not PASSWORD_SPECIAL_PATTERN.search(password):
         raise ValidationError("Password must contain at least one special character")
     
     # Check for common weak passwords
-    weak_passwords = [
-        'password', '12345678', 'qwerty123', 'admin123', 'welcome123',
-        'password123', 'letmein123', 'monkey123', 'dragon123'
-    ]
-    
-    if password.lower() in weak_passwords:
+    if password.lower() in WEAK_PASSWORDS:
         raise ValidationError("This password is too common. Please choose a stronger password")
     
     return password